@@ -1,21 +1,37 @@
 from __future__ import annotations
 
-import json
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
 
 import redis.asyncio as redis  # type: ignore
 
+from .constants import DEFAULT_STREAM_MAXLEN
+from .streams import build_client, decode_text, dumpb, loads
+
 
 class EventBus:
     """Thin wrapper over Redis Streams for publishing and consuming events."""
 
-    def __init__(self, url: str, *, prefix: str = "pipeline") -> None:
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        *,
+        prefix: str = "pipeline",
+        connection_pool: Optional[redis.ConnectionPool] = None,
+        maxlen: Optional[int] = DEFAULT_STREAM_MAXLEN,
+    ) -> None:
         self._url = url
         self._prefix = prefix.rstrip(":")
-        self._client = redis.from_url(url, decode_responses=True)
+        self._name_cache: Dict[str, str] = {}
+        # Payloads are stored as raw orjson bytes; only the short id fields are
+        # decoded on the way out, so large payloads skip two UTF-8 passes.
+        self._client = build_client(url, connection_pool)
+        self._maxlen = maxlen
 
     def stream_name(self, name: str) -> str:
-        return f"{self._prefix}:{name}"
+        cached = self._name_cache.get(name)
+        if cached is None:
+            cached = self._name_cache[name] = f"{self._prefix}:{name}"
+        return cached
 
     async def publish(
         self,
@@ -26,14 +42,14 @@ class EventBus:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> str:
         data: Dict[str, Any] = {
-            "payload": json.dumps(payload, default=str),
+            "payload": dumpb(payload),
         }
         if idempotency_key:
             data["idempotency_key"] = idempotency_key
         if metadata:
-            data["metadata"] = json.dumps(metadata, default=str)
+            data["metadata"] = dumpb(metadata)
         stream_name = self.stream_name(stream)
-        return await self._client.xadd(stream_name, data)
+        return decode_text(await self._client.xadd(stream_name, data, maxlen=self._maxlen, approximate=True))
 
     async def ensure_consumer_group(
         self,
@@ -60,9 +76,15 @@ class EventBus:
         group: str,
         consumer: str,
         *,
-        count: int = 10,
-        block_ms: int = 1000,
+        count: int = 256,
+        block_ms: Optional[int] = 5000,
+        noack: bool = False,
     ) -> List[Tuple[str, Dict[str, Any]]]:
+        """Read up to ``count`` new entries; ``block_ms=None`` returns immediately.
+
+        ``noack`` skips the pending-entries list for at-most-once consumers.
+        """
+
         stream_name = self.stream_name(stream)
         entries = await self._client.xreadgroup(
             group,
@@ -70,24 +92,60 @@ class EventBus:
             streams={stream_name: ">"},
             count=count,
             block=block_ms,
+            noack=noack,
         )
         results: List[Tuple[str, Dict[str, Any]]] = []
         for _, messages in entries:
             for message_id, fields in messages:
-                payload = json.loads(fields.get("payload", "{}"))
-                metadata = json.loads(fields.get("metadata", "{}"))
+                raw_payload = fields.get(b"payload")
+                raw_metadata = fields.get(b"metadata")
                 results.append(
                     (
-                        message_id,
+                        decode_text(message_id),
                         {
-                            "payload": payload,
-                            "metadata": metadata,
-                            "idempotency_key": fields.get("idempotency_key"),
+                            "payload": loads(raw_payload) if raw_payload is not None else {},
+                            "metadata": loads(raw_metadata) if raw_metadata is not None else {},
+                            "idempotency_key": decode_text(fields.get(b"idempotency_key")),
                         },
                     )
                 )
         return results
 
+    async def consume_forever(
+        self,
+        stream: str,
+        group: str,
+        consumer: str,
+        *,
+        count: int = 256,
+        block_ms: int = 5000,
+        noack: bool = False,
+    ) -> AsyncIterator[List[Tuple[str, Dict[str, Any]]]]:
+        """Yield batches indefinitely, draining a backlog without blocking between reads.
+
+        Only an empty read re-arms the blocking XREADGROUP, so bursts are pulled
+        in back-to-back batches of up to ``count`` entries per round-trip. An
+        empty batch is yielded when a blocking read times out so callers can
+        check their own stop conditions.
+        """
+
+        block: Optional[int] = block_ms
+        while True:
+            batch = await self.consume(
+                stream,
+                group,
+                consumer,
+                count=count,
+                block_ms=block,
+                noack=noack,
+            )
+            # Redis treats BLOCK 0 as "wait forever", so drain with no BLOCK at all.
+            if not batch and block is None:
+                block = block_ms
+                continue
+            block = None if batch else block_ms
+            yield batch
+
     async def acknowledge(self, stream: str, group: str, message_ids: Iterable[str]) -> None:
         stream_name = self.stream_name(stream)
         ids = list(message_ids)
@@ -4,3 +4,7 @@ LLM_COMPLETED_STREAM = "llm.completed"
 GRAPH_UPSERTED_STREAM = "graph.upserted"
 
 DEFAULT_GROUP = "grounded-workers"
+
+# Approximate (MAXLEN ~) caps applied on XADD so streams stay bounded.
+DEFAULT_STREAM_MAXLEN = 10_000
+DEFAULT_STATUS_STREAM_MAXLEN = 1_000
@@ -0,0 +1,45 @@
+"""Redis Streams helpers shared by :class:`EventBus` and :class:`TaskStatusTracker`."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import orjson
+import redis.asyncio as redis  # type: ignore
+
+from utils.orjson_response import json_default
+
+
+def _event_default(value: Any) -> Any:
+    # Event payloads have always been best-effort (``default=str``); unknown
+    # objects are stringified here rather than failing the publish.
+    try:
+        return json_default(value)
+    except TypeError:
+        return str(value)
+
+
+def dumpb(value: Any) -> bytes:
+    return orjson.dumps(value, default=_event_default)
+
+
+def loads(raw: Any) -> Any:
+    return orjson.loads(raw)
+
+
+def build_client(url: Optional[str], pool: Optional[redis.ConnectionPool]) -> redis.Redis:
+    """Return a bytes-mode client, reusing ``pool`` when one is shared by the caller."""
+
+    if pool is not None:
+        return redis.Redis(connection_pool=pool)
+    if not url:
+        raise ValueError("Either url or connection_pool is required")
+    return redis.from_url(url, decode_responses=False)
+
+
+def decode_text(value: Any) -> Optional[str]:
+    """Decode a bytes field from a bytes-mode client; other values pass through."""
+
+    if isinstance(value, bytes):
+        return value.decode()
+    return value
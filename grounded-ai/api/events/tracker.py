@@ -1,21 +1,68 @@
 from __future__ import annotations
 
-import json
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
 
 import redis.asyncio as redis  # type: ignore
 
+from .constants import DEFAULT_STATUS_STREAM_MAXLEN
+from .streams import build_client, decode_text, dumpb
+
+
+_SECOND_PREFIX: List[Any] = [-1, ""]
+
+
+def _utc_timestamp() -> str:
+    """RFC 3339 UTC timestamp with microseconds, formatting the date part once per second."""
+
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    if seconds != _SECOND_PREFIX[0]:
+        _SECOND_PREFIX[0] = seconds
+        _SECOND_PREFIX[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+    return f"{_SECOND_PREFIX[1]}.{nanos // 1000:06d}+00:00"
+
+
+def _status_frame(message_id: bytes, fields: Dict[bytes, bytes]) -> bytes:
+    """Render an SSE data frame, splicing the stored payload bytes in verbatim.
+
+    Only the short status/timestamp/id fields are decoded; the payload was
+    written as orjson bytes by :meth:`TaskStatusTracker.append`, so it is
+    already valid JSON and does not need a loads/dumps round-trip.
+    """
+
+    head = dumpb(
+        {
+            "status": decode_text(fields.get(b"status")),
+            "timestamp": decode_text(fields.get(b"timestamp")),
+            "id": decode_text(message_id),
+        }
+    )
+    payload = fields.get(b"payload") or b"{}"
+    return head[:-1] + b',"payload":' + payload + b"}"
+
 
 class TaskStatusTracker:
     """Utility for recording and streaming per-task status events via Redis Streams."""
 
-    def __init__(self, url: str, *, prefix: str = "pipeline") -> None:
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        *,
+        prefix: str = "pipeline",
+        connection_pool: Optional[redis.ConnectionPool] = None,
+        maxlen: Optional[int] = DEFAULT_STATUS_STREAM_MAXLEN,
+    ) -> None:
         self._prefix = prefix.rstrip(":")
-        self._client = redis.from_url(url, decode_responses=True)
+        self._name_cache: Dict[str, str] = {}
+        self._client = build_client(url, connection_pool)
+        self._maxlen = maxlen
 
     def stream_name(self, task_id: str) -> str:
-        return f"{self._prefix}:status:{task_id}"
+        cached = self._name_cache.get(task_id)
+        if cached is None:
+            cached = self._name_cache[task_id] = f"{self._prefix}:status:{task_id}"
+        return cached
 
     async def append(
         self,
@@ -25,38 +72,85 @@ class TaskStatusTracker:
     ) -> str:
         data: Dict[str, Any] = {
             "status": status,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _utc_timestamp(),
         }
         if payload is not None:
-            data["payload"] = json.dumps(payload, default=str)
-        return await self._client.xadd(self.stream_name(task_id), data)
+            data["payload"] = dumpb(payload)
+        entry_id = await self._client.xadd(
+            self.stream_name(task_id),
+            data,
+            maxlen=self._maxlen,
+            approximate=True,
+        )
+        return decode_text(entry_id)
+
+    async def stream(
+        self,
+        task_id: str,
+        last_id: str = "0-0",
+        *,
+        block_ms: int = 30000,
+        count: int = 64,
+        ping_interval: float = 5.0,
+        prefetch: int = 128,
+    ):
+        """Yield status events for ``task_id`` with keepalive pings on a separate timer.
+
+        Each event's ``data`` is the JSON frame as UTF-8 bytes, ready to be
+        written to an SSE response without another encode.
 
-    async def stream(self, task_id: str, last_id: str = "0-0"):
+        XREAD blocks for up to ``block_ms`` and returns as soon as a new entry
+        lands, so long polls cost nothing in latency. Pings are emitted whenever
+        no event has been yielded for ``ping_interval`` seconds, independent of
+        the poll timeout.
+
+        The reader keeps up to ``prefetch`` rendered frames buffered and issues
+        the next XREAD while earlier frames are still being sent to the client,
+        overlapping Redis latency with the HTTP write path. A slow client
+        applies back-pressure once the buffer is full.
+        """
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=prefetch)
+        reader = asyncio.create_task(self._read_into(queue, task_id, last_id, block_ms, count))
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=ping_interval)
+                except asyncio.TimeoutError:
+                    yield {"event": "ping", "data": b"{}"}
+                    continue
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            reader.cancel()
+
+    async def _read_into(
+        self,
+        queue: asyncio.Queue,
+        task_id: str,
+        last_id: str,
+        block_ms: int,
+        count: int,
+    ) -> None:
         stream_name = self.stream_name(task_id)
-        while True:
-            entries = await self._client.xread(
-                {stream_name: last_id},
-                block=5000,
-                count=1,
-            )
-            if not entries:
-                yield {"event": "ping", "data": "{}"}
-                continue
-            _, messages = entries[0]
-            for message_id, fields in messages:
-                last_id = message_id
-                payload = fields.get("payload")
-                if payload is None:
-                    payload_json = "{}"
-                else:
-                    payload_json = payload
-                data = {
-                    "status": fields.get("status"),
-                    "timestamp": fields.get("timestamp"),
-                    "payload": json.loads(payload_json),
-                    "id": message_id,
-                }
-                yield {"event": "status", "data": json.dumps(data)}
+        try:
+            while True:
+                entries = await self._client.xread(
+                    {stream_name: last_id},
+                    block=block_ms,
+                    count=count,
+                )
+                if not entries:
+                    continue
+                _, messages = entries[0]
+                for message_id, fields in messages:
+                    last_id = message_id
+                    await queue.put({"event": "status", "data": _status_frame(message_id, fields)})
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # surface reader failures to the consuming generator
+            await queue.put(exc)
 
     async def close(self) -> None:
         await self._client.aclose()
@@ -1,18 +1,27 @@
+import asyncio
 import os
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+import httpx
+import redis.asyncio as redis  # type: ignore
 from fastapi import FastAPI
 
 from routers import embed, graph, health, llm, pipeline, vision, diag
 from services.clip_embedder import ClipEmbedder
 from events.bus import EventBus
 from events.tracker import TaskStatusTracker
+from services.context_pack import GraphContextBuilder
+from services.graph_repo import GraphRepo
 from services.graph_repository import GraphRepository
 from services.llm_runner import LLMRunner
 from services.neo4j_client import Neo4jClient
 from services.qdrant_client import QdrantVectorStore
+from services.similarity_cache import SimilarityCandidateCache
+from services.upsert_batcher import UpsertBatcher
 from services.vlm_runner import VLMRunner
+from utils.cache import TTLCache
+from utils.orjson_response import ORJSONResponse
 
 
 @asynccontextmanager
@@ -27,9 +36,48 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     clip_embedder = ClipEmbedder.from_env()
     llm_runner = LLMRunner.from_env()
     graph_repo = GraphRepository.from_env()
+    kg_repo = GraphRepo.from_env()
+    context_builder = GraphContextBuilder(kg_repo)
+    upsert_batcher = UpsertBatcher.from_env(kg_repo)
+    upsert_batcher.start()
+    # The caches below are per worker process; see the Dockerfile for the
+    # staleness bound when running more than one worker.
+    # Raw VLM captions keyed by image content; identical re-uploads skip inference.
+    vlm_output_cache = TTLCache(
+        maxsize=int(os.getenv("VLM_OUTPUT_CACHE_SIZE", "512")),
+        ttl=float(os.getenv("VLM_OUTPUT_CACHE_TTL_SECONDS", "3600")),
+    )
+    # The VLM backend is GPU-bound; cap in-flight inference calls so bursts
+    # queue here instead of thrashing GPU memory. The limit is per worker
+    # process, so size it as total slots / WEB_CONCURRENCY.
+    vlm_semaphore = asyncio.Semaphore(int(os.getenv("VLM_MAX_CONCURRENCY", "2")))
+    similarity_cache = SimilarityCandidateCache(
+        float(os.getenv("SIMILARITY_CANDIDATE_CACHE_TTL_SECONDS", "30"))
+    )
     redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-    event_bus = EventBus(redis_url)
-    status_tracker = TaskStatusTracker(redis_url)
+    redis_pool = redis.ConnectionPool.from_url(
+        redis_url,
+        max_connections=int(os.getenv("REDIS_MAX_CONNECTIONS", "64")),
+    )
+    # Pooled client for the remaining loopback calls; keeps connections warm
+    # instead of handshaking per request.
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        timeout=httpx.Timeout(30.0, connect=2.0),
+    )
+    # Lease the first Bolt connections off the request path; a Neo4j that is
+    # still starting just leaves the pool cold.
+    graph_warmup = asyncio.create_task(
+        asyncio.to_thread(kg_repo.warm, int(os.getenv("NEO4J_WARM_CONNECTIONS", "4")))
+    )
+    # In-process client for the /health/* probes /pipeline/analyze runs.
+    health_client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://internal",
+        timeout=2.0,
+    )
+    event_bus = EventBus(connection_pool=redis_pool)
+    status_tracker = TaskStatusTracker(connection_pool=redis_pool)
 
     app.state.neo4j = neo4j_client
     app.state.qdrant = qdrant_client
@@ -37,6 +85,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     app.state.embedder = clip_embedder
     app.state.llm = llm_runner
     app.state.graph_repo = graph_repo
+    app.state.kg_repo = kg_repo
+    app.state.context_builder = context_builder
+    app.state.upsert_batcher = upsert_batcher
+    app.state.similarity_cache = similarity_cache
+    app.state.vlm_output_cache = vlm_output_cache
+    app.state.vlm_semaphore = vlm_semaphore
+    app.state.http_client = http_client
+    app.state.health_client = health_client
     app.state.event_bus = event_bus
     app.state.status_tracker = status_tracker
 
@@ -48,8 +104,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         vlm_runner.close()
         clip_embedder.close()
         llm_runner.close()
+        await upsert_batcher.close()
+        await asyncio.gather(graph_warmup, return_exceptions=True)
+        context_builder.close()
+        kg_repo.close()
         await event_bus.close()
         await status_tracker.close()
+        await redis_pool.aclose()
+        await http_client.aclose()
+        await health_client.aclose()
         # GraphRepository uses lazy HTTP sessions; no explicit close method.
 
 
@@ -57,6 +120,7 @@ app = FastAPI(
     title="Ontology + vLM + LLM Orchestrator",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -1,14 +1,15 @@
 # api/routers/diag.py (새 파일)
 from fastapi import APIRouter
 from pathlib import Path
-import subprocess
-import inspect
 
 from .pipeline import analyze  # 현재 analyze 함수 참조
 
 router = APIRouter(prefix="/__diag", tags=["__diag"])
 
 def _git_sha() -> str:
+    # subprocess/inspect are imported lazily; these endpoints are rarely hit.
+    import subprocess
+
     try:
         return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"]).decode().strip()
     except Exception:
@@ -16,6 +17,8 @@ def _git_sha() -> str:
 
 @router.get("/whoami")
 def whoami():
+    import inspect
+
     return {
         "git_sha": _git_sha(),
         "analyze_file": str(Path(inspect.getsourcefile(analyze)).resolve()),
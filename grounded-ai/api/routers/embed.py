@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field
 
 from services.clip_embedder import ClipEmbedder
 from services.qdrant_client import QdrantVectorStore
+from utils.orjson_response import ORJSONResponse
 
 
 router = APIRouter()
@@ -39,12 +40,16 @@ class TextEmbeddingResponse(BaseModel):
     vector_dim: int
 
 
-@router.post("/text", response_model=TextEmbeddingResponse)
+@router.post(
+    "/text",
+    response_class=ORJSONResponse,
+    responses={200: {"model": TextEmbeddingResponse}},
+)
 async def embed_text(
     payload: TextEmbeddingRequest,
     embedder: ClipEmbedder = Depends(get_embedder),
     vector_store: QdrantVectorStore = Depends(get_vector_store),
-) -> TextEmbeddingResponse:
+) -> ORJSONResponse:
     vector = await embedder.embed_text(payload.text)
     collection = payload.collection or vector_store.default_collection
     point_id = await vector_store.upsert_text(
@@ -53,10 +58,13 @@ async def embed_text(
         vector=vector,
         metadata=payload.metadata,
     )
-    return TextEmbeddingResponse(
-        collection=collection,
-        point_id=point_id,
-        vector_dim=len(vector),
+    # Skip response_model validation and jsonable_encoder; the payload is flat.
+    return ORJSONResponse(
+        {
+            "collection": collection,
+            "point_id": point_id,
+            "vector_dim": len(vector),
+        }
     )
 
 
@@ -66,13 +74,17 @@ class ImageEmbeddingResponse(BaseModel):
     vector_dim: int
 
 
-@router.post("/image", response_model=ImageEmbeddingResponse)
+@router.post(
+    "/image",
+    response_class=ORJSONResponse,
+    responses={200: {"model": ImageEmbeddingResponse}},
+)
 async def embed_image(
     file: UploadFile,
     embedder: ClipEmbedder = Depends(get_embedder),
     vector_store: QdrantVectorStore = Depends(get_vector_store),
     collection: str | None = None,
-) -> ImageEmbeddingResponse:
+) -> ORJSONResponse:
     contents = await file.read()
     vector = await embedder.embed_image(contents)
     target_collection = collection or vector_store.default_collection
@@ -82,8 +94,10 @@ async def embed_image(
         vector=vector,
         mime_type=file.content_type,
     )
-    return ImageEmbeddingResponse(
-        collection=target_collection,
-        point_id=point_id,
-        vector_dim=len(vector),
+    return ORJSONResponse(
+        {
+            "collection": target_collection,
+            "point_id": point_id,
+            "vector_dim": len(vector),
+        }
     )
@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import traceback
+import os
 from datetime import datetime
 from hashlib import sha1
-from typing import Any, List, Mapping, Optional
+from typing import Any, List, Literal, Mapping, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel, ConfigDict, Field, condecimal, confloat, constr
 
 from services.context_pack import GraphContextBuilder
-from services.dedup import dedup_findings
+from services.dedup import finding_signature
 from services.graph_repo import GraphRepo
+from services.similarity_cache import SimilarityCandidateCache
+from services.upsert_batcher import UpsertBatcher
+from utils.cache import TTLCache
+from utils.orjson_response import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
@@ -48,10 +53,47 @@ class UpsertReq(BaseModel):
     findings: List[FindingIn] = []
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
-_GRAPH_REPO = GraphRepo.from_env()
-_CONTEXT_BUILDER = GraphContextBuilder(_GRAPH_REPO)
+
+def get_graph_repo(request: Request) -> GraphRepo:
+    repo: GraphRepo | None = getattr(request.app.state, "kg_repo", None)
+    if repo is None:
+        raise HTTPException(status_code=500, detail="Graph repository unavailable")
+    return repo
+
+
+def get_upsert_batcher(request: Request) -> Optional[UpsertBatcher]:
+    return getattr(request.app.state, "upsert_batcher", None)
+
+
+def get_similarity_cache(request: Request) -> Optional[SimilarityCandidateCache]:
+    return getattr(request.app.state, "similarity_cache", None)
+
+
+GRAPH_CONTEXT_CACHE_SIZE = int(os.getenv("GRAPH_CONTEXT_CACHE_SIZE", "4096"))
+GRAPH_CONTEXT_CACHE_TTL_SECONDS = float(os.getenv("GRAPH_CONTEXT_CACHE_TTL_SECONDS", "60"))
+
+
+def get_context_cache(request: Request) -> TTLCache:
+    """Per-app cache of rendered prompt contexts keyed by ``(image_id, k, mode)``."""
+
+    cache: TTLCache | None = getattr(request.app.state, "graph_context_cache", None)
+    if cache is None:
+        cache = TTLCache(GRAPH_CONTEXT_CACHE_SIZE, GRAPH_CONTEXT_CACHE_TTL_SECONDS)
+        request.app.state.graph_context_cache = cache
+    return cache
+
+
+def invalidate_context_cache(cache: TTLCache, image_id: str) -> None:
+    cache.discard_where(lambda key: key[0] == image_id)
+
+
+def get_context_builder(request: Request) -> GraphContextBuilder:
+    builder: GraphContextBuilder | None = getattr(request.app.state, "context_builder", None)
+    if builder is None:
+        raise HTTPException(status_code=500, detail="Graph context builder unavailable")
+    return builder
 
 
 def _generate_report_id(image_id: str, report: Mapping[str, Any]) -> str:
@@ -61,7 +103,18 @@ def _generate_report_id(image_id: str, report: Mapping[str, Any]) -> str:
     return "R_" + sha1(seed.encode("utf-8")).hexdigest()[:12]
 
 
-def _generate_finding_id(image_id: str, finding: Mapping[str, Any]) -> str:
+def _image_seed(image_id: str) -> Any:
+    """Hash state for the shared ``image_id|`` prefix, copied once per finding."""
+
+    return sha1(f"{image_id}|".encode("utf-8"))
+
+
+def _generate_finding_id(
+    image_id: str,
+    finding: Mapping[str, Any],
+    *,
+    seed: Optional[Any] = None,
+) -> str:
     f_type = finding.get("type") or ""
     location = finding.get("location") or ""
     size_cm = finding.get("size_cm") or 0
@@ -69,32 +122,77 @@ def _generate_finding_id(image_id: str, finding: Mapping[str, Any]) -> str:
         size_val = round(float(size_cm), 1)
     except Exception:
         size_val = 0.0
-    seed = f"{image_id}|{f_type}|{location}|{size_val}"
-    return "f_" + sha1(seed.encode("utf-8")).hexdigest()[:16]
+    digest = (seed or _image_seed(image_id)).copy()
+    digest.update(f"{f_type}|{location}|{size_val}".encode("utf-8"))
+    return "f_" + digest.hexdigest()[:16]
 
 
 @router.post("/upsert")
-async def upsert_case(payload: UpsertReq) -> dict[str, object]:
-    data = payload.model_dump(mode="python")
-    data["findings"] = dedup_findings(data.get("findings") or [])
+async def upsert_case(
+    payload: UpsertReq,
+    repo: GraphRepo = Depends(get_graph_repo),
+    context_cache: TTLCache = Depends(get_context_cache),
+    batcher: Optional[UpsertBatcher] = Depends(get_upsert_batcher),
+    similarity_cache: Optional[SimilarityCandidateCache] = Depends(get_similarity_cache),
+) -> dict[str, object]:
+    # Build the repo payload from attributes; model_dump() walks and copies the
+    # whole model tree only for us to mutate a handful of keys.
+    image = payload.image
+    report = payload.report
+    data: dict[str, Any] = {
+        "case_id": payload.case_id,
+        "image": {"image_id": image.image_id, "path": image.path, "modality": image.modality},
+        "report": {
+            "id": report.id,
+            "text": report.text,
+            "model": report.model,
+            "conf": report.conf,
+            "ts": report.ts,
+        },
+    }
     image_id: str = data["image"]["image_id"]
 
     report_data = data["report"]
     if not report_data.get("id"):
         report_data["id"] = _generate_report_id(image_id, report_data)
 
+    # Dedup and id assignment in one pass over the validated findings.
+    findings: List[dict[str, Any]] = []
     finding_ids: List[str] = []
-    for finding_data in data.get("findings", []):
-        if not finding_data.get("id"):
-            generated_id = _generate_finding_id(image_id, finding_data)
-            finding_data["id"] = generated_id
+    seen: set[tuple[str, str, float]] = set()
+    seed = _image_seed(image_id)
+    for finding in payload.findings:
+        finding_data = {
+            "id": finding.id,
+            "type": finding.type,
+            "location": finding.location,
+            "size_cm": finding.size_cm,
+            "conf": finding.conf,
+        }
+        signature = finding_signature(finding_data)
+        if signature in seen:
+            continue
+        seen.add(signature)
+        if not finding_data["id"]:
+            finding_data["id"] = _generate_finding_id(image_id, finding_data, seed=seed)
+        findings.append(finding_data)
         finding_ids.append(finding_data["id"])
+    data["findings"] = findings
 
     try:
-        _GRAPH_REPO.upsert_case(data)
+        if batcher is not None:
+            # Concurrent upserts are coalesced into one UNWIND transaction.
+            await batcher.submit(data)
+        else:
+            await asyncio.to_thread(repo.upsert_case, data)
     except Exception as exc:  # pragma: no cover - depends on external Neo4j state
         logger.exception("Graph upsert failed for case=%s image=%s", data["case_id"], image_id)
         raise HTTPException(status_code=500, detail=f"Graph upsert failed: {exc}") from exc
+    finally:
+        # Drop cached contexts even on failure; a partial write may still be visible.
+        invalidate_context_cache(context_cache, image_id)
+        if similarity_cache is not None:
+            similarity_cache.invalidate(image_id)
 
     return {
         "ok": True,
@@ -105,6 +203,45 @@ async def upsert_case(payload: UpsertReq) -> dict[str, object]:
     }
 
 
+async def load_prompt_context(
+    context_builder: GraphContextBuilder,
+    context_cache: TTLCache,
+    image_id: str,
+    *,
+    k: int = 2,
+    mode: str = "triples",
+) -> str:
+    """Build (or reuse) the prompt context for ``image_id``, mapping failures to HTTP errors.
+
+    Shared by ``/graph/context`` and in-process callers such as the LLM router.
+    """
+
+    try:
+        return await context_cache.get_or_load(
+            (image_id, k, mode),
+            lambda: asyncio.to_thread(
+                context_builder.build_prompt_context,
+                image_id=image_id,
+                k=k,
+                mode=mode,
+            ),
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except Exception as exc:  # pragma: no cover - depends on external Neo4j state
+        logger.error(
+            "Graph context build failed for image_id=%s mode=%s k=%s: %s",
+            image_id,
+            mode,
+            k,
+            exc,
+        )
+        # exc_info defers traceback formatting to the handler, so nothing is
+        # rendered unless debug logging is actually enabled.
+        logger.debug("Graph context failure traceback", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Graph context build failed: {exc}") from exc
+
+
 @router.get("/context")
 async def get_context(
     image_id: Optional[str] = Query(
@@ -116,25 +253,14 @@ async def get_context(
         description="Legacy query parameter for the image identifier",
     ),
     k: int = Query(2, ge=1, le=10, description="Top-k evidence paths to include"),
-    mode: str = Query("triples", pattern="^(triples|json)$", description="triples → formatted summary, json → raw facts JSON"),
+    mode: Literal["triples", "json"] = Query("triples", description="triples → formatted summary, json → raw facts JSON"),
+    context_builder: GraphContextBuilder = Depends(get_context_builder),
+    context_cache: TTLCache = Depends(get_context_cache),
 ) -> dict[str, str]:
     resolved_id = image_id or id
     if not resolved_id:
         raise HTTPException(status_code=422, detail="image_id is required")
-    try:
-        context = _CONTEXT_BUILDER.build_prompt_context(image_id=resolved_id, k=k, mode=mode)
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # pragma: no cover - depends on external Neo4j state
-        logger.error(
-            "Graph context build failed for image_id=%s mode=%s k=%s: %s",
-            resolved_id,
-            mode,
-            k,
-            exc,
-        )
-        logger.debug("Graph context failure traceback:\n%s", traceback.format_exc())
-        raise HTTPException(status_code=500, detail=f"Graph context build failed: {exc}") from exc
+    context = await load_prompt_context(context_builder, context_cache, resolved_id, k=k, mode=mode)
     return {"context": context}
 
 
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+import time
 from typing import Any, Dict
 
 from fastapi import APIRouter, Request
 
 router = APIRouter(tags=["health"])
 
+# Load balancers typically probe /health every second; reuse the last
+# aggregate for this long instead of hitting every backend on each probe.
+HEALTH_CACHE_TTL_SECONDS = float(os.getenv("HEALTH_CACHE_TTL_SECONDS", "1.0"))
+
 
 def _app_version() -> str:
     return (
@@ -57,11 +63,25 @@ async def _neo4j_ok(request: Request) -> bool:
 
 
 async def _collect_status(request: Request) -> Dict[str, bool]:
-    return {
-        "llm": await _llm_ok(request),
-        "vlm": await _vlm_ok(request),
-        "neo4j": await _neo4j_ok(request),
+    state = request.app.state
+    cached = getattr(state, "health_status_cache", None)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < HEALTH_CACHE_TTL_SECONDS:
+        return dict(cached[1])
+
+    llm, vlm, neo4j = await asyncio.gather(
+        _llm_ok(request),
+        _vlm_ok(request),
+        _neo4j_ok(request),
+        return_exceptions=True,
+    )
+    statuses = {
+        "llm": llm is True,
+        "vlm": vlm is True,
+        "neo4j": neo4j is True,
     }
+    state.health_status_cache = (now, statuses)
+    return dict(statuses)
 
 
 @router.get("/health", name="health_root")
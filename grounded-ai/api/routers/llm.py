@@ -2,20 +2,30 @@
 
 from __future__ import annotations
 
-import base64
+import asyncio
 import os
+import re
 import time
+from contextlib import asynccontextmanager
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, Request
-from pydantic import BaseModel, Field, field_validator
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 
 from services.dummy_dataset import lookup_entry
 from services.llm_runner import LLMRunner
 from services.consensus import modality_penalty
+from services.context_pack import GraphContextBuilder
+from utils.b64 import b64encode_ascii
+from utils.orjson_response import ORJSONResponse
+
+from .graph import get_context_cache, load_prompt_context
+from .vision import CaptionRequest, create_caption_response
 
 
 class AnswerMode(str, Enum):
@@ -25,6 +35,8 @@ class AnswerMode(str, Enum):
 
 
 class LLMAnswerReq(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     mode: AnswerMode
     image_id: Optional[str] = None
     caption: Optional[str] = None
@@ -44,16 +56,49 @@ class LLMAnswerReq(BaseModel):
     def _strip_caption(cls, value: Optional[str]) -> Optional[str]:
         if value is None:
             return None
-        cleaned = " ".join(value.split()).strip()
+        cleaned = " ".join(value.split())
         return cleaned or None
 
 
+async def parse_llm_answer_req(request: Request) -> LLMAnswerReq:
+    """Validate the raw body in one pass instead of json.loads followed by model_validate."""
+
+    body = await request.body()
+    try:
+        return LLMAnswerReq.model_validate_json(body)
+    except ValidationError as exc:
+        errors = exc.errors(include_url=False)
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in errors],
+            body=body,
+        ) from exc
+
+
+def _inline_schema(model: type[BaseModel]) -> Dict[str, Any]:
+    """JSON schema for ``model`` with local ``$defs`` inlined, for use in openapi_extra."""
+
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+
+    def _resolve(node: Any) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str) and ref.startswith("#/$defs/"):
+                return _resolve(defs[ref.rsplit("/", 1)[-1]])
+            return {key: _resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [_resolve(item) for item in node]
+        return node
+
+    return _resolve(schema)
+
+
 class AnswerResponse(BaseModel):
     answer: str
     latency_ms: int = Field(..., ge=0)
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 _DEFAULT_DATA_ROOT = Path(
     os.getenv("MEDICAL_DUMMY_DIR", Path(__file__).resolve().parents[2] / "data" / "medical_dummy")
@@ -73,6 +118,28 @@ VGL_TEMPLATE = """[GRAPH CONTEXT]
 이 영상을 한국어 한 줄로 요약하라.
 """
 
+# Templates pre-split on their placeholders so prompts render as a single
+# f-string instead of re-parsing the format spec on every request.
+_V_HEAD, _V_TAIL = V_TEMPLATE.split("{caption}")
+_V_MID, _V_END = _V_TAIL.split("{max_chars}")
+_VGL_HEAD, _VGL_TAIL = VGL_TEMPLATE.split("{graph_triples}")
+_VGL_MID, _VGL_END = _VGL_TAIL.split("{max_chars}")
+
+
+def _v_prompt(caption: str, max_chars: int) -> str:
+    return f"{_V_HEAD}{caption}{_V_MID}{max_chars}{_V_END}"
+
+
+def _vgl_prompt(graph_triples: str, max_chars: int) -> str:
+    return f"{_VGL_HEAD}{graph_triples}{_VGL_MID}{max_chars}{_VGL_END}"
+
+
+def get_prompt_context_builder(request: Request) -> Optional[GraphContextBuilder]:
+    """Lifespan-owned builder (and its pooled driver); ``None`` falls back to the HTTP route."""
+
+    return getattr(request.app.state, "context_builder", None)
+
+
 def get_llm(request: Request) -> LLMRunner:
     runner: LLMRunner | None = getattr(request.app.state, "llm", None)
     if runner is None:
@@ -84,9 +151,23 @@ class LLMInputError(ValueError):
     """Raised when required inputs for LLM prompting are missing."""
 
 
+_WORD = re.compile(r"\S+")
+
+
 def clamp_one_line(text: str, limit: int) -> str:
-    cleaned = " ".join(text.split())
-    return cleaned[:limit]
+    if len(text) <= limit:
+        return " ".join(text.split())
+    # Stop collecting words once ``limit`` characters are covered, so a long
+    # generation is neither split nor joined past what the slice keeps.
+    words: List[str] = []
+    size = -1
+    for match in _WORD.finditer(text):
+        if size >= limit:
+            break
+        word = match.group()
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)[:limit]
 
 
 def _caption_from_normalised(
@@ -116,7 +197,7 @@ async def run_vl_mode(
     max_chars: int,
 ) -> Dict[str, Any]:
     caption = _caption_from_normalised(normalized, error_message="caption is required for VL mode")
-    prompt = V_TEMPLATE.format(caption=caption, max_chars=max_chars)
+    prompt = _v_prompt(caption, max_chars)
     start = time.perf_counter()
     result = await llm.generate(prompt, temperature=0.2)
     answer = clamp_one_line(str(result.get("output", "")), max_chars)
@@ -138,7 +219,7 @@ async def run_vgl_mode(
     context_clean = (context_str or "").strip()
     start = time.perf_counter()
     if context_clean:
-        prompt = VGL_TEMPLATE.format(graph_triples=context_clean, max_chars=max_chars)
+        prompt = _vgl_prompt(context_clean, max_chars)
         result = await llm.generate(prompt, temperature=0.2)
         answer = clamp_one_line(str(result.get("output", "")), max_chars)
         latency_ms = _llm_latency(result, start)
@@ -176,8 +257,18 @@ def _extract_error_detail(response: httpx.Response) -> str:
     return response.text
 
 
-def _resolve_image_payload(image_id: str) -> Optional[dict[str, str]]:
-    """Return a payload suitable for /vision/caption calls."""
+_IMAGE_DIRS = (
+    _DEFAULT_DATA_ROOT / "images",
+    _DEFAULT_DATA_ROOT,
+    Path("/data/medical_dummy/images"),
+    Path("/data/images"),
+    Path("/data"),
+)
+
+
+@lru_cache(maxsize=512)
+def _image_candidates(image_id: str) -> Tuple[Path, ...]:
+    """Candidate file locations for ``image_id`` in lookup order (no filesystem access)."""
 
     entry = lookup_entry(id=image_id)
     filenames: list[str] = []
@@ -191,32 +282,60 @@ def _resolve_image_payload(image_id: str) -> Optional[dict[str, str]]:
         cleaned_filename = cleaned
     filenames.append(cleaned_filename)
 
-    image_dirs = [
-        _DEFAULT_DATA_ROOT / "images",
-        _DEFAULT_DATA_ROOT,
-        Path("/data/medical_dummy/images"),
-        Path("/data/images"),
-        Path("/data"),
-    ]
-
-    for directory in image_dirs:
-        for name in filenames:
-            candidate = directory / name
-            if candidate.exists():
-                try:
-                    image_bytes = candidate.read_bytes()
-                except OSError:
-                    continue
-                image_b64 = base64.b64encode(image_bytes).decode("utf-8")
-                return {"id": image_id, "image_b64": image_b64}
+    return tuple(directory / name for directory in _IMAGE_DIRS for name in filenames)
+
+
+def _locate_image(image_id: str) -> Optional[Path]:
+    for candidate in _image_candidates(image_id):
+        if candidate.is_file():
+            return candidate
     return None
 
 
-async def _fetch_graph_context(request: Request, image_id: str) -> str:
+def _resolve_image_payload(image_id: str) -> Optional[dict[str, str]]:
+    """Return a payload suitable for /vision/caption calls."""
+
+    for candidate in _image_candidates(image_id):
+        if not candidate.exists():
+            continue
+        try:
+            image_bytes = candidate.read_bytes()
+        except OSError:
+            continue
+        return {"id": image_id, "image_b64": b64encode_ascii(image_bytes)}
+    return None
+
+
+@asynccontextmanager
+async def _loopback_client(request: Request) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the app-wide pooled client, or a throwaway one when none is configured."""
+
+    client: httpx.AsyncClient | None = getattr(request.app.state, "http_client", None)
+    if client is not None:
+        yield client
+        return
+    async with httpx.AsyncClient() as fallback:
+        yield fallback
+
+
+async def _fetch_graph_context(
+    request: Request,
+    image_id: str,
+    builder: Optional[GraphContextBuilder] = None,
+) -> str:
+    if builder is None:
+        return await _fetch_graph_context_http(request, image_id)
+    # In-process call: same cache and error mapping as /graph/context without
+    # the HTTP encode → parse → validate round trip.
+    context = await load_prompt_context(builder, get_context_cache(request), image_id, mode="triples")
+    return str(context or "").strip()
+
+
+async def _fetch_graph_context_http(request: Request, image_id: str) -> str:
     url = request.url_for("get_context")
-    async with httpx.AsyncClient(timeout=15.0) as client:
+    async with _loopback_client(request) as client:
         try:
-            response = await client.get(url, params={"id": image_id, "mode": "triples"})
+            response = await client.get(url, params={"id": image_id, "mode": "triples"}, timeout=15.0)
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
             detail = _extract_error_detail(exc.response)
@@ -229,14 +348,34 @@ async def _fetch_graph_context(request: Request, image_id: str) -> str:
 
 
 async def _fetch_caption_from_vision(request: Request, image_id: str) -> str:
-    payload = _resolve_image_payload(image_id)
-    if payload is None:
+    runner = getattr(request.app.state, "vlm", None)
+    if runner is None:
+        # Filesystem probing, the read and the base64 encode all stay off the event loop.
+        payload = await asyncio.to_thread(_resolve_image_payload, image_id)
+        if payload is None:
+            raise HTTPException(status_code=422, detail="empty graph context")
+        return await _fetch_caption_http(request, payload)
+
+    # In-process the caption helper can read the file itself, so skip the
+    # base64 round trip (and the temp file it would otherwise spill to).
+    image_path = await asyncio.to_thread(_locate_image, image_id)
+    if image_path is None:
         raise HTTPException(status_code=422, detail="empty graph context")
+    caption_request = CaptionRequest(id=image_id, file_path=str(image_path))
+    response, _, _, _ = await create_caption_response(
+        caption_request, runner, vlm_slots=getattr(request.app.state, "vlm_semaphore", None)
+    )
+    caption = response.report.text.strip()
+    if not caption:
+        raise HTTPException(status_code=502, detail="caption fallback unavailable")
+    return caption
+
 
+async def _fetch_caption_http(request: Request, payload: dict[str, str]) -> str:
     url = request.url_for("generate_caption")
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with _loopback_client(request) as client:
         try:
-            response = await client.post(url, json=payload)
+            response = await client.post(url, json=payload, timeout=30.0)
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
             detail = _extract_error_detail(exc.response)
@@ -254,6 +393,36 @@ async def _fetch_caption_from_vision(request: Request, image_id: str) -> str:
     return caption
 
 
+# Speculative caption fetches run a full VLM inference that is thrown away
+# whenever the graph context turns out non-empty (the common case), and
+# cancelling the task does not stop work already on the model server. They
+# are therefore off unless LLM_CAPTION_PREFETCH_LIMIT opts in; once the cap is
+# saturated, requests fetch the caption on demand.
+_CAPTION_PREFETCH_LIMIT = int(os.getenv("LLM_CAPTION_PREFETCH_LIMIT", "0"))
+_CAPTION_PREFETCH: Optional[asyncio.Semaphore] = (
+    asyncio.Semaphore(_CAPTION_PREFETCH_LIMIT) if _CAPTION_PREFETCH_LIMIT > 0 else None
+)
+
+
+async def _prefetch_caption(request: Request, image_id: str, slots: asyncio.Semaphore) -> str:
+    async with slots:
+        return await _fetch_caption_from_vision(request, image_id)
+
+
+def _discard_task(task: Optional[asyncio.Task[Any]]) -> None:
+    if task is None:
+        return
+    task.cancel()
+    # Retrieve the outcome so an already-failed prefetch is not reported as unhandled.
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+def _answer_response(answer: str, latency_ms: Any) -> ORJSONResponse:
+    # Both fields are produced locally, so serialise directly instead of
+    # building and re-validating an AnswerResponse model per request.
+    return ORJSONResponse({"answer": str(answer), "latency_ms": max(int(latency_ms), 0)})
+
+
 def _llm_latency(result: dict[str, object], start: float) -> int:
     latency = result.get("latency_ms")
     if isinstance(latency, (int, float)):
@@ -261,12 +430,22 @@ def _llm_latency(result: dict[str, object], start: float) -> int:
     return int((time.perf_counter() - start) * 1000)
 
 
-@router.post("/answer", response_model=AnswerResponse)
+@router.post(
+    "/answer",
+    responses={200: {"model": AnswerResponse}},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _inline_schema(LLMAnswerReq)}},
+        }
+    },
+)
 async def answer_endpoint(
-    payload: LLMAnswerReq,
     request: Request,
-    llm: LLMRunner = Depends(get_llm),
-) -> AnswerResponse:
+    payload: LLMAnswerReq = Depends(parse_llm_answer_req),
+) -> ORJSONResponse:
+    # The runner and builder are looked up per branch rather than via Depends,
+    # so V mode (a clipped caption) never resolves or requires either of them.
     start = time.perf_counter()
 
     max_chars = payload.max_chars
@@ -282,24 +461,49 @@ async def answer_endpoint(
         latency_ms = int((time.perf_counter() - start) * 1000)
         if not result.get("latency_ms"):
             result["latency_ms"] = latency_ms
-        return AnswerResponse(answer=result["text"], latency_ms=int(result["latency_ms"]))
+        return _answer_response(result["text"], result["latency_ms"])
 
+    llm = get_llm(request)
     if payload.mode == AnswerMode.VL:
         try:
             result = await run_vl_mode(llm, normalized or {}, max_chars)
         except LLMInputError as exc:
             raise HTTPException(status_code=422, detail=str(exc)) from exc
-        return AnswerResponse(answer=result["text"], latency_ms=int(result["latency_ms"]))
+        return _answer_response(result["text"], result["latency_ms"])
 
     # VGL mode
     if not payload.image_id:
         raise HTTPException(status_code=422, detail="image_id is required for VGL mode")
 
-    context_text = await _fetch_graph_context(request, payload.image_id)
+    caption_task: Optional[asyncio.Task[str]] = None
+    prefetch_slots = _CAPTION_PREFETCH
+    if (
+        payload.fallback_to_vl
+        and normalized is None
+        and prefetch_slots is not None
+        and not prefetch_slots.locked()
+    ):
+        # Overlap the fallback caption with the graph lookup so an empty context
+        # costs max(ctx, caption) rather than ctx + caption.
+        caption_task = asyncio.create_task(_prefetch_caption(request, payload.image_id, prefetch_slots))
+    try:
+        context_text = await _fetch_graph_context(
+            request,
+            payload.image_id,
+            get_prompt_context_builder(request),
+        )
+    except BaseException:
+        _discard_task(caption_task)
+        raise
 
     normalized_for_vgl = normalized
-    if not context_text and payload.fallback_to_vl and normalized_for_vgl is None:
-        caption = await _fetch_caption_from_vision(request, payload.image_id)
+    if context_text:
+        _discard_task(caption_task)
+    elif payload.fallback_to_vl and normalized_for_vgl is None:
+        if caption_task is not None:
+            caption = await caption_task
+        else:
+            caption = await _fetch_caption_from_vision(request, payload.image_id)
         normalized_for_vgl = {"report": {"text": caption}}
 
     try:
@@ -314,7 +518,7 @@ async def answer_endpoint(
     except LLMInputError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
 
-    return AnswerResponse(answer=result["text"], latency_ms=int(result["latency_ms"]))
+    return _answer_response(result["text"], result["latency_ms"])
 
 
 __all__ = [
@@ -2,41 +2,47 @@
 
 from __future__ import annotations
 modality: Optional[str] = None,
-import base64
+import asyncio
 import binascii
 import logging
 import os
+import re
 import time
 from contextlib import contextmanager
 from itertools import combinations
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 import hashlib
 
 import httpx
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, field_validator
 
-from models.pipeline import AnalyzeResp
+from models.pipeline import AnalyzeResp, DummyEvaluation
 from services.context_pack import GraphContextBuilder
 from services.context_orchestrator import ContextLimits, ContextOrchestrator
 from services.debug_payload import DebugPayloadBuilder
 from services.dummy_registry import DummyFindingRegistry, DummyImageRegistry
 from services.dedup import dedup_findings
 from services.finding_validation import FindingValidationError, validate_findings_payload
-from services.finding_verifier import FindingVerifier
+from services.finding_verifier import FindingVerificationResult, FindingVerifier
 from services.graph_repo import GraphRepo
 from services.fallback_meta import FallbackMeta, FallbackMetaError, coerce_fallback_meta, FallbackMetaGuard
 from services.image_identity import ImageIdentityError, identify_image
 from services.llm_runner import LLMRunner
 from services.normalizer import normalize_from_vlm, _normalise_findings
-from services.consensus import compute_consensus, normalise_for_consensus, _jaccard_similarity
+from services.consensus import compute_consensus, _consensus_tokens, _token_jaccard
 from services.similarity import compute_similarity_scores
 from services.vlm_runner import VLMRunner
+from utils.b64 import b64decode
+from utils.orjson_response import ORJSONResponse, json_default
 
+from .graph import invalidate_context_cache
 from .llm import (
     LLMInputError,
+    clamp_one_line,
     get_llm,
     run_v_mode,
     run_vgl_mode,
@@ -45,7 +51,7 @@ from .llm import (
 
 GRAPH_TRIPLE_CHAR_CAP = 1800
 
-router = APIRouter(prefix="/pipeline", tags=["pipeline"])
+router = APIRouter(prefix="/pipeline", tags=["pipeline"], default_response_class=ORJSONResponse)
 
 logger = logging.getLogger(__name__)
 
@@ -112,15 +118,52 @@ class AnalyzeReq(BaseModel):
         return float(value)
 
 
-def clamp_one_line(text: str, max_chars: int) -> str:
-    """Utility used for inline fallbacks where LLM helpers are not involved."""
+# Post-consensus safety filter: organ terms that contradict the organ implied
+# by the file path. One alternation scans the consensus text in a single pass.
+ORGAN_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "brain": ("brain", "cerebral", "stroke", "infarct"),
+    "liver": ("liver", "hepatic"),
+    "lung": ("lung", "pulmonary"),
+    "heart": ("heart", "cardiac"),
+}
+_ORGAN_BY_KEYWORD: Dict[str, str] = {kw: organ for organ, kws in ORGAN_KEYWORDS.items() for kw in kws}
+# Zero-width lookahead so overlapping mentions ("cerebralung") are all found,
+# matching the substring checks this replaces.
+_ORGAN_TERMS = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw in sorted(_ORGAN_BY_KEYWORD, key=len, reverse=True)) + "))"
+)
+
+
+def _infer_expected_from_path(file_path: Optional[str]) -> Optional[str]:
+    if not isinstance(file_path, str) or not file_path:
+        return None
+    path_lower = file_path.lower()
+    if "brain" in path_lower or "head" in path_lower:
+        return "brain"
+    if "liver" in path_lower or "abdomen" in path_lower:
+        return "liver"
+    if "chest" in path_lower:
+        return "lung"
+    return None
+
+
+def _offending_organs(text: str, expected_organ: str) -> List[str]:
+    """Organs other than ``expected_organ`` mentioned in ``text``, in ``ORGAN_KEYWORDS`` order."""
+
+    mentioned = {_ORGAN_BY_KEYWORD[kw] for kw in _ORGAN_TERMS.findall(text.lower())}
+    return [organ for organ in ORGAN_KEYWORDS if organ != expected_organ and organ in mentioned]
 
-    cleaned = " ".join(text.split())
-    return cleaned[:max_chars]
+
+async def _timed(awaitable: Awaitable[Dict[str, Any]]) -> Tuple[Dict[str, Any], int]:
+    """Await ``awaitable`` and report its own wall time, even when run as one of several tasks."""
+
+    start = time.perf_counter()
+    result = await awaitable
+    return result, int((time.perf_counter() - start) * 1000)
 
 
 @contextmanager
-def timeit(target: Dict[str, int], key: str) -> None:
+def timeit(target: Dict[str, int], key: str) -> Iterator[None]:
     start = time.perf_counter()
     try:
         yield
@@ -135,6 +178,30 @@ def _get_vlm(request: Request) -> VLMRunner:
     return runner
 
 
+def _get_graph_repo(request: Request) -> Optional[GraphRepo]:
+    """Process-wide repo from the lifespan; ``None`` when the app was built without one."""
+
+    return getattr(request.app.state, "kg_repo", None)
+
+
+def _invalidate_graph_context(request: Request, *image_ids: Optional[str]) -> None:
+    """Drop /graph/context cache entries for images this request just wrote."""
+
+    cache = getattr(request.app.state, "graph_context_cache", None)
+    if cache is None:
+        return
+    for value in image_ids:
+        if value:
+            invalidate_context_cache(cache, value)
+
+
+def _similarity_candidates(request: Request, graph_repo: GraphRepo, image_id: str) -> List[Dict[str, Any]]:
+    cache = getattr(request.app.state, "similarity_cache", None)
+    if cache is None:
+        return graph_repo.fetch_similarity_candidates(image_id)
+    return cache.candidates(graph_repo, image_id)
+
+
 def _is_truthy(value: object) -> bool:
     if isinstance(value, bool):
         return value
@@ -162,10 +229,15 @@ def _compute_cache_seed(payload: AnalyzeReq) -> Optional[str]:
     return None
 
 
-def _read_image_bytes(payload: AnalyzeReq) -> tuple[bytes, Optional[str]]:
+def _resolve_image_source(payload: AnalyzeReq) -> Tuple[Optional[bytes], Optional[str]]:
+    """Return ``(decoded_bytes, None)`` for ``image_b64`` or ``(None, path)`` for ``file_path``.
+
+    File paths are handed to the VLM as-is; the image is never read into memory here.
+    """
+
     if payload.image_b64:
         try:
-            return base64.b64decode(payload.image_b64), None
+            return b64decode(payload.image_b64), None
         except (ValueError, binascii.Error):
             raise HTTPException(status_code=422, detail="invalid base64 image payload")
     if payload.file_path:
@@ -173,35 +245,81 @@ def _read_image_bytes(payload: AnalyzeReq) -> tuple[bytes, Optional[str]]:
         if not path.exists():
             raise HTTPException(status_code=422, detail="file_path does not exist")
         try:
-            return path.read_bytes(), str(path)
+            # Surface unreadable paths (permissions, directories) as before
+            # without copying the file.
+            with path.open("rb"):
+                pass
         except OSError as exc:
             raise HTTPException(status_code=422, detail=f"failed to read file: {exc}") from exc
+        return None, str(path)
     raise HTTPException(status_code=422, detail="either image_b64 or file_path is required")
 
 
+_DEPENDENCY_PROBES: Tuple[Tuple[str, str], ...] = (
+    ("/health/llm", "llm"),
+    ("/health/vlm", "vlm"),
+    ("/health/neo4j", "neo4j"),
+)
+# Bursts of /analyze reuse a recent all-green probe instead of re-checking.
+DEPENDENCY_CHECK_TTL_SECONDS = float(os.getenv("ANALYZE_DEPENDENCY_CHECK_TTL_SECONDS", "2.0"))
+# Starting VL before the context read hides its latency when VGL degrades, but
+# the call is thrown away whenever prior graph evidence keeps VGL alive.
+SPECULATIVE_VL_ENABLED = _is_truthy(os.getenv("ANALYZE_SPECULATIVE_VL", "0"))
+
+
+def _dependency_ok(result: object) -> bool:
+    if not isinstance(result, httpx.Response) or result.status_code != 200:
+        return False
+    payload = result.json()
+    return isinstance(payload, dict) and bool(payload.get("ok"))
+
+
+async def _probe_dependencies(client: httpx.AsyncClient) -> None:
+    results = await asyncio.gather(
+        *(client.get(path) for path, _ in _DEPENDENCY_PROBES),
+        return_exceptions=True,
+    )
+    for (_, label), result in zip(_DEPENDENCY_PROBES, results):
+        if isinstance(result, BaseException) and not isinstance(result, httpx.HTTPError):
+            raise result
+        if not _dependency_ok(result):
+            raise HTTPException(status_code=503, detail={"ok": False, "where": label})
+
+
+def _dependencies_fresh(state: Any) -> bool:
+    checked_at: Optional[float] = getattr(state, "dependencies_ok_at", None)
+    return checked_at is not None and time.monotonic() - checked_at < DEPENDENCY_CHECK_TTL_SECONDS
+
+
 async def _ensure_dependencies(request: Request) -> None:
-    transport = httpx.ASGITransport(app=request.app)
-    async with httpx.AsyncClient(transport=transport, base_url="http://internal") as client:
-        for path, label in [
-            ("/health/llm", "llm"),
-            ("/health/vlm", "vlm"),
-            ("/health/neo4j", "neo4j"),
-        ]:
-            try:
-                response = await client.get(path)
-            except httpx.HTTPError:
-                raise HTTPException(status_code=503, detail={"ok": False, "where": label})
-            if response.status_code != 200:
-                raise HTTPException(status_code=503, detail={"ok": False, "where": label})
-            payload = response.json()
-            if not isinstance(payload, dict) or not payload.get("ok"):
-                raise HTTPException(status_code=503, detail={"ok": False, "where": label})
+    state = request.app.state
+    if _dependencies_fresh(state):
+        return
+
+    lock: Optional[asyncio.Lock] = getattr(state, "dependency_check_lock", None)
+    if lock is None:
+        lock = state.dependency_check_lock = asyncio.Lock()
+    # Requests arriving while the cached result is stale share one probe
+    # round instead of each firing their own.
+    async with lock:
+        if _dependencies_fresh(state):
+            return
+        state.dependencies_ok_at = None
+        client: Optional[httpx.AsyncClient] = getattr(state, "health_client", None)
+        if client is not None:
+            await _probe_dependencies(client)
+        else:
+            transport = httpx.ASGITransport(app=request.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://internal") as client:
+                await _probe_dependencies(client)
+        state.dependencies_ok_at = time.monotonic()
 
 
 @router.post(
     "/analyze",
-    response_model=AnalyzeResp,
-    response_model_exclude_none=False,
+    # Documented for OpenAPI only: the handler returns an ORJSONResponse (or
+    # an NDJSON stream), so FastAPI's dump + revalidate pass is skipped.
+    responses={200: {"model": AnalyzeResp}},
 )
 async def analyze(
     payload: AnalyzeReq,
@@ -211,14 +329,85 @@ async def analyze(
         False,
         description="Emit pre/post-upsert diagnostics (truthy values: 1,true,on,yes)",
     ),
+    stream: bool = Query(
+        False,
+        description="Stream NDJSON stage frames as they complete, ending with the full response",
+    ),
     llm: LLMRunner = Depends(get_llm),
     vlm: VLMRunner = Depends(_get_vlm),
-) -> AnalyzeResp:
+    shared_graph_repo: Optional[GraphRepo] = Depends(_get_graph_repo),
+) -> Any:
     if not sync:
         raise HTTPException(status_code=400, detail="async execution is not supported")
 
     await _ensure_dependencies(request)
 
+    if not stream:
+        response = await _run_analysis(
+            payload, request, debug=debug, llm=llm, vlm=vlm, shared_graph_repo=shared_graph_repo
+        )
+        return ORJSONResponse(response.model_dump(mode="json"))
+
+    frames: "asyncio.Queue[object]" = asyncio.Queue()
+    task = asyncio.create_task(
+        _run_analysis(
+            payload,
+            request,
+            debug=debug,
+            llm=llm,
+            vlm=vlm,
+            shared_graph_repo=shared_graph_repo,
+            emit=frames.put_nowait,
+        )
+    )
+    task.add_done_callback(lambda _: frames.put_nowait(_STREAM_END))
+    return StreamingResponse(_ndjson_frames(frames, task), media_type="application/x-ndjson")
+
+
+_STREAM_END = object()
+
+
+def _ndjson(frame: Dict[str, Any]) -> bytes:
+    return orjson.dumps(frame, default=json_default) + b"\n"
+
+
+async def _ndjson_frames(frames: "asyncio.Queue[object]", task: "asyncio.Task[AnalyzeResp]") -> AsyncIterator[bytes]:
+    """Yield stage frames until the analysis finishes, then a ``done`` or ``error`` frame."""
+
+    try:
+        while True:
+            frame = await frames.get()
+            if frame is _STREAM_END:
+                break
+            yield _ndjson(frame)  # type: ignore[arg-type]
+        try:
+            response = task.result()
+        except HTTPException as exc:
+            yield _ndjson({"stage": "error", "status_code": exc.status_code, "detail": exc.detail})
+        except Exception as exc:  # pragma: no cover - _run_analysis maps errors to HTTPException
+            yield _ndjson({"stage": "error", "status_code": 500, "detail": str(exc)})
+        else:
+            yield _ndjson({"stage": "done", "response": response.model_dump(mode="json")})
+    finally:
+        # Client went away mid-stream: stop the analysis instead of finishing it unseen.
+        if not task.done():
+            task.cancel()
+
+
+async def _run_analysis(
+    payload: AnalyzeReq,
+    request: Request,
+    *,
+    debug: bool | int | str,
+    llm: LLMRunner,
+    vlm: VLMRunner,
+    shared_graph_repo: Optional[GraphRepo],
+    emit: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> AnalyzeResp:
+    def _emit(frame: Dict[str, Any]) -> None:
+        if emit is not None:
+            emit(frame)
+
     debug_enabled = _is_truthy(debug)
 
     timings: Dict[str, int] = {
@@ -235,8 +424,11 @@ async def analyze(
     overall_notes: Optional[str] = None
     graph_degraded = False
     graph_repo: Optional[GraphRepo] = None
+    owns_graph_repo = False
     finding_verifier: Optional[FindingVerifier] = None
     context_builder: Optional[GraphContextBuilder] = None
+    vl_task: Optional["asyncio.Task[Tuple[Dict[str, Any], int]]"] = None
+    vgl_task: Optional["asyncio.Task[Tuple[Dict[str, Any], int]]"] = None
     debug_builder = DebugPayloadBuilder(enabled=debug_enabled)
     param_overrides: Dict[str, Any] = dict(payload.parameters or {})
     force_dummy_fallback = _is_truthy(param_overrides.get("force_dummy_fallback"))
@@ -420,40 +612,33 @@ async def analyze(
 
     try:
         current_stage = "image_load"
-        try:
-            image_bytes, image_path = _read_image_bytes(payload)
-        except HTTPException:
-            raise
+        # Base64 decode of a multi-MB upload and the path stat/open both
+        # block, so they run off the event loop.
+        image_bytes, image_path = await asyncio.to_thread(_resolve_image_source, payload)
         debug_builder.set_stage(current_stage)
 
-        temp_file: Optional[str] = None
-        image_path_for_vlm = image_path
-        if image_path_for_vlm is None:
-            suffix = Path(payload.file_path or "image.png").suffix or ".png"
-            with NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-                tmp.write(image_bytes)
-                temp_file = tmp.name
-            image_path_for_vlm = temp_file
-
         current_stage = "vlm"
+        # Inline base64 uploads go to the VLM from memory; file_path is then
+        # only a metadata hint for identity and persistence.
         with timeit(timings, "vlm_ms"):
             normalized = await normalize_from_vlm(
-                file_path=image_path_for_vlm,
+                file_path=image_path or payload.file_path,
                 image_id=payload.image_id,
                 vlm_runner=vlm,
                 force_dummy_fallback=force_dummy_fallback,
                 cache_seed=normalization_cache_seed,
                 enable_cache=debug_enabled,
+                output_cache=getattr(request.app.state, "vlm_output_cache", None),
+                vlm_slots=getattr(request.app.state, "vlm_semaphore", None),
+                image_bytes=image_bytes,
             )
+        # Release the decoded upload; nothing below needs it.
+        image_bytes = None
         debug_builder.set_stage(current_stage)
 
-        if temp_file:
-            try:
-                os.unlink(temp_file)
-            except OSError:
-                pass
-
-        normalized_image = dict(normalized.get("image") or {})
+        # identify_image works on its own copy, and ``normalized`` is ours alone
+        # (normalize_from_vlm builds it per call), so nothing here is copied defensively.
+        normalized_image = normalized.get("image") or {}
         resolved_path = payload.file_path or image_path
         try:
             identity, normalized_image = identify_image(
@@ -488,17 +673,29 @@ async def analyze(
         )
 
         normalized["image"] = normalized_image
+        _emit(
+            {
+                "stage": "vlm",
+                "case_id": case_id,
+                "image_id": image_id,
+                "caption": normalized.get("caption"),
+                "vlm_ms": timings["vlm_ms"],
+            }
+        )
 
-        normalized_report = dict(normalized.get("report") or {})
-        if normalized_report.get("conf") is not None:
-            normalized_report["conf"] = float(normalized_report["conf"])
-        else:
+        normalized_report = normalized.get("report")
+        if not normalized_report:
+            normalized_report = normalized["report"] = {}
+        report_conf = normalized_report.get("conf")
+        if report_conf is None:
             normalized_report["conf"] = 0.8
-        normalized["report"] = normalized_report
+        elif not isinstance(report_conf, float):
+            normalized_report["conf"] = float(report_conf)
 
         # Normalize + dedup findings (keep list[dict] invariant)
-        label_normalization_events: List[Dict[str, Any]] = list(normalized.get("label_normalization") or [])
-        normalized_findings = dedup_findings(list(normalized.get("findings") or []))
+        label_normalization_events: List[Dict[str, Any]] = normalized.get("label_normalization") or []
+        # dedup_findings already returns fresh finding dicts.
+        normalized_findings = dedup_findings(normalized.get("findings") or [])
         normalized_findings = _validate_findings(normalized_findings)
 
         if not label_normalization_events and normalized_findings:
@@ -624,24 +821,29 @@ async def analyze(
                 },
             )
 
-        debug_builder.record_identity(
-            normalized_image=normalized_image,
-            image_id=image_id,
-            image_id_source=image_id_source,
-            storage_uri=storage_uri,
-            lookup_hit=bool(lookup_result),
-            lookup_source=lookup_source,
-            warn_on_lookup_miss=(not lookup_result and image_id_source != "payload"),
-            fallback_meta=fallback_guard.snapshot("debug_identity"),
-            finding_source=finding_source,
-            seeded_finding_ids=seeded_finding_ids,
-            provenance=provenance_payload,
-            pre_upsert_findings=normalized_findings,
-            report_confidence=normalized_report.get("conf"),
-            label_normalization=label_normalization_events,
-        )
+        if debug_enabled:
+            # The snapshot only feeds the debug blob and its fallback history.
+            debug_builder.record_identity(
+                normalized_image=normalized_image,
+                image_id=image_id,
+                image_id_source=image_id_source,
+                storage_uri=storage_uri,
+                lookup_hit=bool(lookup_result),
+                lookup_source=lookup_source,
+                warn_on_lookup_miss=(not lookup_result and image_id_source != "payload"),
+                fallback_meta=fallback_guard.snapshot("debug_identity"),
+                finding_source=finding_source,
+                seeded_finding_ids=seeded_finding_ids,
+                provenance=provenance_payload,
+                pre_upsert_findings=normalized_findings,
+                report_confidence=normalized_report.get("conf"),
+                label_normalization=label_normalization_events,
+            )
 
-        graph_repo = GraphRepo.from_env()
+        # Lease sessions from the shared driver pool; only a repo opened here
+        # (apps without the lifespan) is closed in ``finally``.
+        graph_repo = shared_graph_repo or GraphRepo.from_env()
+        owns_graph_repo = shared_graph_repo is None
         finding_verifier = FindingVerifier(graph_repo)
         context_builder = GraphContextBuilder(graph_repo)
         context_orchestrator = ContextOrchestrator(context_builder)
@@ -657,6 +859,21 @@ async def analyze(
             },
         )
 
+        # Without findings, VGL almost always degrades to VL (only prior graph
+        # evidence for this image keeps it alive); ANALYZE_SPECULATIVE_VL starts
+        # that VL call now rather than after the upsert/context round-trips.
+        speculative_vl = (
+            SPECULATIVE_VL_ENABLED
+            and "VL" not in payload.modes
+            and "VGL" in payload.modes
+            and payload.fallback_to_vl
+            and not normalized_findings
+        )
+        if "VL" in payload.modes or speculative_vl:
+            # VL only needs the caption, so start it now and let it overlap the
+            # graph stages and the VGL call instead of running after them.
+            vl_task = asyncio.create_task(_timed(run_vl_mode(llm, normalized, payload.max_chars)))
+
         current_stage = "upsert"
         image_payload = {
             "image_id": image_id,
@@ -678,23 +895,35 @@ async def analyze(
             raise HTTPException(status_code=422, detail={"ok": False, "errors": errors}) from exc
         if debug_enabled:
             debug_builder.record_upsert_payload(raw_payload=graph_payload, prepared_payload=prepared_graph_payload)
+        expected_finding_ids = [str(finding.get("id")) for finding in normalized_findings if isinstance(finding.get("id"), str)]
+        verification: Optional[FindingVerificationResult] = None
         with timeit(timings, "upsert_ms"):
-            upsert_receipt_raw = graph_repo.upsert_case(graph_payload)
+            # Bolt calls run off the event loop so the in-flight VL task and
+            # other requests keep progressing during graph I/O.
+            if expected_finding_ids and finding_verifier is not None:
+                # Upsert and the persisted-ID re-read share one transaction.
+                upsert_receipt_raw, verification = await asyncio.to_thread(
+                    finding_verifier.upsert_and_verify, graph_payload, expected_finding_ids
+                )
+            else:
+                upsert_receipt_raw = await asyncio.to_thread(graph_repo.upsert_case, graph_payload)
         upsert_receipt = dict(upsert_receipt_raw or {})
         resolved_image_id = upsert_receipt.get("image_id")
+        written_image_ids = (image_id, resolved_image_id)
+        similarity_cache = getattr(request.app.state, "similarity_cache", None)
+        if similarity_cache is not None:
+            similarity_cache.invalidate(image_id, resolved_image_id)
         if resolved_image_id:
             image_id = resolved_image_id
             normalized_image["image_id"] = resolved_image_id
             normalized["image"]["image_id"] = resolved_image_id
         finding_ids = [fid for fid in list(upsert_receipt.get("finding_ids") or []) if isinstance(fid, str)]
-        expected_finding_ids = [str(finding.get("id")) for finding in normalized_findings if isinstance(finding.get("id"), str)]
         verified_finding_ids: List[str] = []
 
         if expected_finding_ids:
             try:
-                if finding_verifier is None:
+                if verification is None:
                     raise RuntimeError("finding verifier unavailable")
-                verification = finding_verifier.verify(image_id, expected_finding_ids)
                 verified_finding_ids = list(verification.actual)
             except Exception as exc:
                 errors.append({"stage": "upsert_verify", "msg": str(exc)})
@@ -727,7 +956,7 @@ async def analyze(
         if graph_repo is not None:
             current_stage = "similarity"
             try:
-                candidates = graph_repo.fetch_similarity_candidates(image_id)
+                candidates = await asyncio.to_thread(_similarity_candidates, request, graph_repo, image_id)
                 similarity_candidates_debug = len(candidates)
                 new_image_payload = {
                     "modality": normalized_image.get("modality"),
@@ -740,10 +969,16 @@ async def analyze(
                     top_k=10,
                 )
                 similar_seed_images = summary_payload
-                similarity_edges_created = graph_repo.sync_similarity_edges(image_id, edges_payload)
+                similarity_edges_created = await asyncio.to_thread(
+                    graph_repo.sync_similarity_edges, image_id, edges_payload
+                )
             except Exception as exc:
                 errors.append({"stage": "similarity", "msg": str(exc)})
 
+        # The upsert and the SIMILAR_TO edges both feed this image's context;
+        # drop anything cached for it once both writes have landed.
+        _invalidate_graph_context(request, image_id, *written_image_ids)
+
         current_stage = "context"
         limits = ContextLimits(
             k_paths=resolved_k_paths,
@@ -753,7 +988,8 @@ async def analyze(
             slot_overrides=slot_overrides or None,
         )
         with timeit(timings, "context_ms"):
-            context_result = context_orchestrator.build(
+            context_result = await asyncio.to_thread(
+                context_orchestrator.build,
                 image_id=image_id,
                 normalized_findings=normalized_findings,
                 graph_degraded=graph_degraded,
@@ -761,6 +997,15 @@ async def analyze(
             )
 
         context_bundle = context_result.bundle
+        _emit(
+            {
+                "stage": "context",
+                "image_id": image_id,
+                "upsert_ms": timings["upsert_ms"],
+                "context_ms": timings["context_ms"],
+                "paths": len(context_result.paths),
+            }
+        )
         facts = context_result.facts
         findings_list = context_result.findings
         paths_list = context_result.paths
@@ -825,46 +1070,53 @@ async def analyze(
 
         results: Dict[str, Dict[str, Any]] = {}
 
+        run_vgl_llm = "VGL" in payload.modes and bool(normalized_findings or not no_graph_evidence)
+        if run_vgl_llm and speculative_vl and vl_task is not None:
+            vl_task.cancel()
+        if run_vgl_llm:
+            vgl_task = asyncio.create_task(
+                _timed(
+                    run_vgl_mode(
+                        llm,
+                        image_id,
+                        context_bundle.get("triples", ""),
+                        payload.max_chars,
+                        payload.fallback_to_vl,
+                        normalized,
+                    )
+                )
+            )
+
         if "V" in payload.modes:
             current_stage = "llm_v"
-            start = time.perf_counter()
             try:
-                v_result = run_v_mode(normalized, payload.max_chars)
+                with timeit(timings, "llm_v_ms"):
+                    v_result = run_v_mode(normalized, payload.max_chars)
             except LLMInputError as exc:
                 raise HTTPException(status_code=422, detail=str(exc)) from exc
-            timings["llm_v_ms"] = int((time.perf_counter() - start) * 1000)
             v_result.setdefault("latency_ms", timings["llm_v_ms"])
             v_result["text"] = clamp_one_line(v_result.get("text", ""), payload.max_chars)
             results["V"] = v_result
+            _emit({"stage": "mode", "mode": "V", "result": dict(v_result)})
 
         vl_result: Optional[Dict[str, Any]] = None
-        if "VL" in payload.modes:
+        if vl_task is not None and not speculative_vl:
             current_stage = "llm_vl"
-            start = time.perf_counter()
             try:
-                vl_result = await run_vl_mode(llm, normalized, payload.max_chars)
+                vl_result, timings["llm_vl_ms"] = await vl_task
             except LLMInputError as exc:
                 raise HTTPException(status_code=422, detail=str(exc)) from exc
-            timings["llm_vl_ms"] = int((time.perf_counter() - start) * 1000)
             vl_result.setdefault("latency_ms", timings["llm_vl_ms"])
             results["VL"] = vl_result
+            _emit({"stage": "mode", "mode": "VL", "result": dict(vl_result)})
 
         if "VGL" in payload.modes:
-            if normalized_findings or not no_graph_evidence:
+            if vgl_task is not None:
                 current_stage = "llm_vgl"
-                start = time.perf_counter()
                 try:
-                    vgl_result = await run_vgl_mode(
-                        llm,
-                        image_id,
-                        context_bundle.get("triples", ""),
-                        payload.max_chars,
-                        payload.fallback_to_vl,
-                        normalized,
-                    )
+                    vgl_result, timings["llm_vgl_ms"] = await vgl_task
                 except LLMInputError as exc:
                     raise HTTPException(status_code=422, detail=str(exc)) from exc
-                timings["llm_vgl_ms"] = int((time.perf_counter() - start) * 1000)
                 vgl_result.setdefault("latency_ms", timings["llm_vgl_ms"])
                 degraded_marker = vgl_result.get("degraded")
                 degraded_mode: Optional[str] = None
@@ -885,12 +1137,15 @@ async def analyze(
                 if payload.fallback_to_vl:
                     if vl_result is None:
                         current_stage = "llm_vl"
-                        start = time.perf_counter()
                         try:
-                            vl_result = await run_vl_mode(llm, normalized, payload.max_chars)
+                            if vl_task is not None:
+                                vl_result, timings["llm_vl_ms"] = await vl_task
+                            else:
+                                vl_result, timings["llm_vl_ms"] = await _timed(
+                                    run_vl_mode(llm, normalized, payload.max_chars)
+                                )
                         except LLMInputError as exc:
                             raise HTTPException(status_code=422, detail=str(exc)) from exc
-                        timings["llm_vl_ms"] = int((time.perf_counter() - start) * 1000)
                         vl_result.setdefault("latency_ms", timings["llm_vl_ms"])
                         results.setdefault("VL", vl_result)
                     timings["llm_vgl_ms"] = 0
@@ -904,6 +1159,9 @@ async def analyze(
                     timings["llm_vgl_ms"] = 0
                     results["VGL"] = {"text": "Graph findings unavailable", "latency_ms": 0, "degraded": False}
 
+        if "VGL" in results:
+            _emit({"stage": "mode", "mode": "VGL", "result": dict(results["VGL"])})
+
         if finding_source and isinstance(results.get("VGL"), dict):
             results["VGL"]["finding_source"] = finding_source
             if seeded_finding_ids:
@@ -912,8 +1170,8 @@ async def analyze(
         vgl_entry = results.get("VGL")
         if has_paths and isinstance(vgl_entry, dict) and not vgl_entry.get("degraded"):
             vgl_text = vgl_entry.get("text")
-            vgl_norm = normalise_for_consensus(vgl_text) if isinstance(vgl_text, str) else ""
-            if vgl_norm:
+            vgl_tokens = _consensus_tokens(vgl_text) if isinstance(vgl_text, str) else frozenset()
+            if vgl_tokens:
                 for mode_name in ("V", "VL"):
                     entry = results.get(mode_name)
                     if not isinstance(entry, dict):
@@ -925,8 +1183,8 @@ async def analyze(
                         entry["degraded"] = "graph_mismatch"
                         entry.setdefault("notes", "mismatch with graph-backed output")
                         continue
-                    mode_norm = normalise_for_consensus(mode_text)
-                    if not mode_norm or _jaccard_similarity(mode_norm, vgl_norm) < 0.1:
+                    mode_tokens = _consensus_tokens(mode_text)
+                    if not mode_tokens or _token_jaccard(mode_tokens, vgl_tokens) < 0.1:
                         entry["degraded"] = "graph_mismatch"
                         entry.setdefault("notes", "mismatch with graph-backed output")
 
@@ -986,32 +1244,10 @@ async def analyze(
         results["finding_provenance"] = dict(provenance_payload)
 
         # --- Post-consensus safety filter ---
-        ORGAN_KEYWORDS = {
-            "brain": ["brain", "cerebral", "stroke", "infarct"],
-            "liver": ["liver", "hepatic"],
-            "lung": ["lung", "pulmonary"],
-            "heart": ["heart", "cardiac"],
-        }
-
-        def _infer_expected_from_path(file_path: Optional[str]):
-            if not isinstance(file_path, str) or not file_path:
-                return None
-            path_lower = file_path.lower()
-            if "brain" in path_lower or "head" in path_lower:
-                return "brain"
-            if "liver" in path_lower or "abdomen" in path_lower:
-                return "liver"
-            if "chest" in path_lower:
-                return "lung"
-            return None
-
         expected_organ = _infer_expected_from_path(payload.file_path)
 
         if expected_organ:
-            offending = []
-            for organ, kws in ORGAN_KEYWORDS.items():
-                if organ != expected_organ and any(kw in consensus["text"].lower() for kw in kws):
-                    offending.append(organ)
+            offending = _offending_organs(consensus["text"], expected_organ)
             if offending:
                 consensus["status"] = "disagree"
                 consensus["confidence"] = "very_low"
@@ -1094,18 +1330,31 @@ async def analyze(
         if response_notes_parts:
             response["notes"] = " | ".join(part for part in response_notes_parts if part)
 
-        return AnalyzeResp(**response)
+        # Every field but ``evaluation`` is built above with its declared type;
+        # full validation would re-walk the graph_context and debug trees.
+        response["evaluation"] = DummyEvaluation.model_validate(evaluation_payload)
+        return AnalyzeResp.model_construct(**response)
 
     except HTTPException:
         raise
     except LLMInputError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
     except Exception as exc:
+        # An unexpected failure may be a dependency that went down inside the
+        # probe TTL; make the next request re-check instead of trusting it.
+        request.app.state.dependencies_ok_at = None
         errors.append({"stage": current_stage, "msg": str(exc)})
         detail = {"ok": False, "errors": errors}
         raise HTTPException(status_code=500, detail=detail) from exc
     finally:
+        for task in (vl_task, vgl_task):
+            if task is None:
+                continue
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()  # mark retrieved when an earlier stage already failed
         if context_builder is not None:
             context_builder.close()
-        if graph_repo is not None:
+        if graph_repo is not None and owns_graph_repo:
             graph_repo.close()
@@ -5,9 +5,9 @@ import hashlib
 import logging
 import os
 import time
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 from typing import Optional, Tuple
 from uuid import uuid4
 
@@ -365,11 +365,18 @@ def _build_caption_report(
 async def create_caption_response(
     payload: CaptionRequest,
     runner: VLMRunner,
+    *,
+    vlm_slots: Optional[asyncio.Semaphore] = None,
 ) -> Tuple[CaptionResponse, Optional[dict[str, object]], Optional[str], dict[str, object]]:
-    """Shared captioning helper used by both the API endpoint and the pipeline router."""
+    """Shared captioning helper used by both the API endpoint and the pipeline router.
+
+    ``vlm_slots`` is the app-wide VLM concurrency cap (``app.state.vlm_semaphore``).
+    """
 
     try:
-        image_bytes, resolved_path = decode_image_payload(payload.image_b64, payload.file_path)
+        image_bytes, resolved_path = await asyncio.to_thread(
+            decode_image_payload, payload.image_b64, payload.file_path
+        )
     except FileNotFoundError as exc:  # pragma: no cover - depends on host FS
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     except ValueError as exc:
@@ -377,20 +384,13 @@ async def create_caption_response(
 
     entry = lookup_entry(id=payload.id, file_path=resolved_path or payload.file_path)
     id = ensure_id(entry=entry, explicit_id=payload.id, image_bytes=image_bytes)
-    temp_file: Optional[str] = None
-    image_path_for_vlm = resolved_path or payload.file_path
-    if image_path_for_vlm is None:
-        suffix = Path(payload.file_path or f"{id}.png").suffix or ".png"
-        with NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            tmp.write(image_bytes)
-            temp_file = tmp.name
-        image_path_for_vlm = temp_file
-
     try:
         normalized = await normalize_from_vlm(
-            file_path=image_path_for_vlm,
+            file_path=resolved_path or payload.file_path,
             image_id=id,
             vlm_runner=runner,
+            image_bytes=image_bytes,
+            vlm_slots=vlm_slots,
         )
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -398,12 +398,6 @@ async def create_caption_response(
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except Exception as exc:  # pragma: no cover - runtime issues
         raise HTTPException(status_code=502, detail="Vision model invocation failed") from exc
-    finally:
-        if temp_file:
-            try:
-                os.unlink(temp_file)
-            except OSError:
-                pass
 
     normalized_image = dict(normalized.get("image") or {})
     normalized_report = dict(normalized.get("report") or {})
@@ -458,11 +452,14 @@ async def create_caption_response(
 @router.post("/caption", response_model=CaptionResponse)
 async def generate_caption(
     payload: CaptionRequest,
+    request: Request,
     runner: VLMRunner = Depends(get_vlm),
 ) -> CaptionResponse:
     """Caption endpoint exposing the minimal contract required by the evaluation scripts."""
 
-    response, _, _, _ = await create_caption_response(payload, runner)
+    response, _, _, _ = await create_caption_response(
+        payload, runner, vlm_slots=getattr(request.app.state, "vlm_semaphore", None)
+    )
     return response
 
 
@@ -498,7 +495,7 @@ async def create_vision_task(
     extension = Path(image.filename or "upload.png").suffix or ".png"
     stored_path = upload_dir / f"{derived_id}{extension}"
     try:
-        stored_path.write_bytes(contents)
+        await asyncio.to_thread(stored_path.write_bytes, contents)
     except Exception as exc:  # pragma: no cover
         logger.error("Failed to persist image bytes for task %s: %s", task_id, exc)
         raise HTTPException(status_code=500, detail="Failed to persist uploaded image data") from exc
@@ -549,7 +546,7 @@ async def stream_task_events(
 ):
     async def event_generator():
         async for event in tracker.stream(task_id):
-            yield f"event: {event['event']}\ndata: {event['data']}\n\n"
+            yield b"event: " + event["event"].encode() + b"\ndata: " + event["data"] + b"\n\n"
 
     return StreamingResponse(
         event_generator(),
@@ -560,6 +557,7 @@ async def stream_task_events(
 
 @router.post("/inference", response_model=VisionInferenceResponse)
 async def run_inference(
+    request: Request,
     image: UploadFile,
     prompt: str = Form(..., description="Instruction for the VLM (caption/VQA)"),
     llm_prompt: str = Form(
@@ -611,17 +609,18 @@ async def run_inference(
     extension = Path(image.filename or "upload.png").suffix or ".png"
     stored_path = upload_dir / f"{derived_id}{extension}"
     try:
-        stored_path.write_bytes(contents)
+        await asyncio.to_thread(stored_path.write_bytes, contents)
     except Exception as exc:  # pragma: no cover - filesystem errors
         logger.error("Failed to persist image bytes: %s", exc)
         raise HTTPException(status_code=500, detail="Failed to persist uploaded image data") from exc
 
-    vlm_result = await runner.generate(
-        image_bytes=contents,
-        prompt=prompt,
-        task=task,
-        temperature=temperature,
-    )
+    async with getattr(request.app.state, "vlm_semaphore", None) or nullcontext():
+        vlm_result = await runner.generate(
+            image_bytes=contents,
+            prompt=prompt,
+            task=task,
+            temperature=temperature,
+        )
 
     vlm_output = vlm_result.get("output", "")
     logger.info(
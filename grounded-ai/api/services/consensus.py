@@ -7,12 +7,15 @@ outputs plus optional weighting/anchor hints.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import lru_cache
 from itertools import combinations
-from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
 
 CONSENSUS_AGREEMENT_THRESHOLD = 0.6
 CONSENSUS_HIGH_CONFIDENCE_THRESHOLD = 0.8
 CONSENSUS_MODE_PRIORITY: Tuple[str, ...] = ("VGL", "VL", "V")
+_MODE_PRIORITY_INDEX: Dict[str, int] = {mode: index for index, mode in enumerate(CONSENSUS_MODE_PRIORITY)}
 
 TEXT_SIMILARITY_WEIGHT = 0.6
 STRUCTURED_OVERLAP_WEIGHT = 0.3
@@ -31,27 +34,55 @@ __all__ = [
 ]
 
 
+@dataclass(slots=True)
+class ModeResult:
+    """Per-mode scoring inputs, derived once when the mode output is ingested."""
+
+    text: str
+    tokens: FrozenSet[str]
+    degraded: Any
+    penalty: float
+    penalty_terms: List[str]
+    effective_weight: float
+    structured_overlap: float
+
+
 def normalise_for_consensus(text: str) -> str:
     """Lowercase and squeeze whitespace to normalise free-form text."""
 
     return " ".join(text.lower().split())
 
 
+@lru_cache(maxsize=2048)
+def _consensus_tokens(text: str) -> FrozenSet[str]:
+    """Token set of ``normalise_for_consensus(text)``; the mismatch gate and scoring share it."""
+
+    return frozenset(text.lower().split())
+
+
 def _jaccard_similarity(a: str, b: str) -> float:
-    tokens_a = set(a.split())
-    tokens_b = set(b.split())
-    if not tokens_a and not tokens_b:
-        return 1.0
-    if not tokens_a or not tokens_b:
-        return 0.0
-    return len(tokens_a & tokens_b) / len(tokens_a | tokens_b)
+    return _token_jaccard(frozenset(a.split()), frozenset(b.split()))
+
+
+def _token_jaccard(tokens_a: FrozenSet[str], tokens_b: FrozenSet[str]) -> float:
+    """Jaccard over pre-tokenised texts; callers tokenise each text once."""
+
+    # One empty side yields 0/len(other) == 0.0; both empty count as agreement.
+    intersection = len(tokens_a & tokens_b)
+    union = len(tokens_a) + len(tokens_b) - intersection
+    return intersection / union if union else 1.0
+
+
+def _mode_priority(mode: str) -> int:
+    return _MODE_PRIORITY_INDEX.get(mode, len(_MODE_PRIORITY_INDEX))
 
 
 def _preferred_mode(modes: Sequence[str]) -> Optional[str]:
-    for mode in CONSENSUS_MODE_PRIORITY:
-        if mode in modes:
-            return mode
-    return modes[0] if modes else None
+    return min(
+        (mode for mode in modes if mode in _MODE_PRIORITY_INDEX),
+        key=_MODE_PRIORITY_INDEX.__getitem__,
+        default=modes[0] if modes else None,
+    )
 
 
 def _normalise_term(value: Any) -> Optional[str]:
@@ -147,32 +178,30 @@ def compute_consensus(
     type_terms, location_terms = _collect_finding_terms(structured_findings)
     graph_signal = max(0.0, min(1.0, float(graph_paths_strength or 0.0)))
 
-    available: Dict[str, Dict[str, Any]] = {}
+    available: Dict[str, ModeResult] = {}
     mode_weights_raw: Dict[str, float] = {}
+    banned_terms = BANNED_BY_MODALITY.get(modality_key, []) if modality_key else []
     for mode, payload in results.items():
         if not isinstance(payload, dict):
             continue
         text = payload.get("text")
         if isinstance(text, str) and text.strip():
             lowered = text.lower()
-            banned_terms = BANNED_BY_MODALITY.get(modality_key, []) if modality_key else []
             offending_terms = [term for term in banned_terms if term in lowered]
-            penalty = modality_penalty(text, modality_key)
+            # Same rule as modality_penalty(), reusing the terms found above.
+            penalty = -0.2 if offending_terms else 0.0
             if penalty < 0:
                 penalised_modes.add(mode)
             base_weight = weight_map.get(mode, 1.0)
-            effective_weight = max(base_weight + penalty, 0.0)
-            available[mode] = {
-                "text": text,
-                "normalised": normalise_for_consensus(text),
-                "latency_ms": payload.get("latency_ms"),
-                "degraded": payload.get("degraded"),
-                "penalty": penalty,
-                "penalty_terms": offending_terms,
-                "effective_weight": effective_weight,
-                "base_weight": base_weight,
-                "structured_overlap": _structured_overlap_score(text, type_terms, location_terms),
-            }
+            available[mode] = ModeResult(
+                text=text,
+                tokens=_consensus_tokens(text),
+                degraded=payload.get("degraded"),
+                penalty=penalty,
+                penalty_terms=offending_terms,
+                effective_weight=max(base_weight + penalty, 0.0),
+                structured_overlap=_structured_overlap_score(text, type_terms, location_terms),
+            )
             mode_weights_raw[mode] = max(base_weight, 0.0)
 
     total_modes = len(available)
@@ -190,7 +219,7 @@ def compute_consensus(
         sole_mode = next(iter(available.keys()))
         data = available[sole_mode]
         return {
-            "text": data["text"],
+            "text": data.text,
             "status": "single",
             "supporting_modes": [sole_mode],
             "disagreed_modes": [],
@@ -206,16 +235,10 @@ def compute_consensus(
     best_pair_graph_bonus = False
     best_components = {"text": 0.0, "structured": 0.0, "graph": 0.0, "penalty": 0.0}
     for (mode_a, data_a), (mode_b, data_b) in combinations(available.items(), 2):
-        score = _jaccard_similarity(data_a["normalised"], data_b["normalised"])
-        weight_a = data_a.get("effective_weight", weight_map.get(mode_a, 1.0))
-        weight_b = data_b.get("effective_weight", weight_map.get(mode_b, 1.0))
-        pair_weight = max(weight_a + weight_b, 0.0) / 2.0
-        penalty_adjustment = (
-            min(data_a.get("penalty", 0.0), 0.0) + min(data_b.get("penalty", 0.0), 0.0)
-        ) / 2.0
-        structure_bonus = (
-            data_a.get("structured_overlap", 0.0) + data_b.get("structured_overlap", 0.0)
-        ) / 2.0
+        score = _token_jaccard(data_a.tokens, data_b.tokens)
+        pair_weight = max(data_a.effective_weight + data_b.effective_weight, 0.0) / 2.0
+        penalty_adjustment = (min(data_a.penalty, 0.0) + min(data_b.penalty, 0.0)) / 2.0
+        structure_bonus = (data_a.structured_overlap + data_b.structured_overlap) / 2.0
         pair_has_vgl = "VGL" in (mode_a, mode_b)
         graph_bonus = GRAPH_EVIDENCE_WEIGHT * graph_signal if pair_has_vgl else 0.0
         text_component = score * TEXT_SIMILARITY_WEIGHT
@@ -229,7 +252,7 @@ def compute_consensus(
             best_raw_score = adjusted_score
             best_pair_weight = pair_weight
             best_pair_penalty_modes = tuple(
-                sorted({candidate for candidate in (mode_a, mode_b) if available[candidate]["penalty"] < 0})
+                sorted({candidate for candidate in (mode_a, mode_b) if available[candidate].penalty < 0})
             )
             best_pair_graph_bonus = graph_bonus > 0
             best_components = {
@@ -247,16 +270,12 @@ def compute_consensus(
         if agreement_score >= effective_threshold:
             supporting_modes = sorted(
                 best_pair,
-                key=lambda mode: CONSENSUS_MODE_PRIORITY.index(mode)
-                if mode in CONSENSUS_MODE_PRIORITY
-                else len(CONSENSUS_MODE_PRIORITY),
+                key=_mode_priority,
             )
         elif agreement_score >= fallback_threshold and best_pair_weight > 1.0:
             supporting_modes = sorted(
                 best_pair,
-                key=lambda mode: CONSENSUS_MODE_PRIORITY.index(mode)
-                if mode in CONSENSUS_MODE_PRIORITY
-                else len(CONSENSUS_MODE_PRIORITY),
+                key=_mode_priority,
             )
             fallback_used = True
 
@@ -264,7 +283,7 @@ def compute_consensus(
     anchor_mode_used = False
     if not supporting_modes and anchor_mode and anchor_mode in available:
         anchor_data = available[anchor_mode]
-        degraded_marker = anchor_data.get("degraded")
+        degraded_marker = anchor_data.degraded
         if not degraded_marker:
             supporting_modes = [anchor_mode]
             anchor_mode_used = True
@@ -272,10 +291,10 @@ def compute_consensus(
 
     consensus_text: Optional[str] = None
     if supporting_modes:
-        conflicted = [mode for mode in supporting_modes if available[mode].get("penalty", 0.0) < 0]
+        conflicted = [mode for mode in supporting_modes if available[mode].penalty < 0]
         if conflicted:
             penalty_note = "modality conflict: " + ", ".join(sorted(conflicted))
-            supporting_modes = [mode for mode in supporting_modes if available[mode]["penalty"] >= 0]
+            supporting_modes = [mode for mode in supporting_modes if available[mode].penalty >= 0]
     elif best_pair_penalty_modes:
         penalty_note = "modality conflict: " + ", ".join(best_pair_penalty_modes)
 
@@ -283,25 +302,23 @@ def compute_consensus(
     if supporting_modes:
         supporting_modes = sorted(
             dict.fromkeys(supporting_modes),
-            key=lambda mode: CONSENSUS_MODE_PRIORITY.index(mode)
-            if mode in CONSENSUS_MODE_PRIORITY
-            else len(CONSENSUS_MODE_PRIORITY),
+            key=_mode_priority,
         )
         preferred = _preferred_mode(supporting_modes) or supporting_modes[0]
-        consensus_text = available[preferred]["text"]
-        consensus_norm = available[preferred]["normalised"]
+        consensus_text = available[preferred].text
+        consensus_tokens = available[preferred].tokens
         for mode, data in available.items():
-            if mode in supporting_modes or data.get("degraded"):
+            if mode in supporting_modes or data.degraded:
                 continue
-            if not consensus_norm:
+            if not consensus_tokens:
                 continue
-            similarity = _jaccard_similarity(consensus_norm, data["normalised"])
-            structured_overlap = data.get("structured_overlap", 0.0)
+            similarity = _token_jaccard(consensus_tokens, data.tokens)
+            structured_overlap = data.structured_overlap
             if similarity >= fallback_threshold or structured_overlap >= 0.5:
                 supporting_modes.append(mode)
 
         preferred = _preferred_mode(supporting_modes) or supporting_modes[0]
-        consensus_text = available[preferred]["text"]
+        consensus_text = available[preferred].text
         status = "agree"
         if anchor_mode_used:
             confidence = "high" if agreement_score >= CONSENSUS_HIGH_CONFIDENCE_THRESHOLD else "medium"
@@ -317,13 +334,13 @@ def compute_consensus(
             notes = "agreement across requested modes"
     else:
         preferred = _preferred_mode(list(available.keys())) or next(iter(available.keys()))
-        consensus_text = available[preferred]["text"]
+        consensus_text = available[preferred].text
         confidence = "low"
         status = "disagree"
         supporting_modes = [preferred] if preferred else []
         notes = "outputs diverged across modes"
-        if available.get(preferred, {}).get("penalty", 0.0) < 0:
-            terms = available.get(preferred, {}).get("penalty_terms", [])
+        if available[preferred].penalty < 0:
+            terms = available[preferred].penalty_terms
             detail_terms = ", ".join(sorted(set(terms))) if terms else "unexpected content"
             penalty_detail = f"penalised terms: {detail_terms}"
             penalty_note = f"{penalty_note} | {penalty_detail}" if penalty_note else penalty_detail
@@ -331,7 +348,7 @@ def compute_consensus(
 
     supporting_set = set(supporting_modes)
     disagreed_modes = sorted(set(available.keys()) - supporting_set)
-    degraded_inputs = sorted(mode for mode, data in available.items() if data.get("degraded"))
+    degraded_inputs = sorted(mode for mode, data in available.items() if data.degraded)
     total_modes = len(available)
     support_count = len(supporting_set)
     vote_summary = {
@@ -373,7 +390,7 @@ def compute_consensus(
         all_notes.append(penalty_note)
     if status != "disagree":
         structured_alignment = any(
-            available.get(mode, {}).get("structured_overlap", 0.0) >= 0.5 for mode in supporting_modes
+            available[mode].structured_overlap >= 0.5 for mode in supporting_modes
         )
         if structured_alignment:
             all_notes.append("structured finding terms aligned across agreeing modes")
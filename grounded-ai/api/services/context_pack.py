@@ -7,8 +7,11 @@ import re
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Sequence
 
+import orjson
 from pydantic import BaseModel, Field, ConfigDict, model_validator
 
+from utils.orjson_response import json_default
+
 from .graph_repo import GraphRepo
 
 
@@ -37,23 +40,33 @@ _SUMMARY_REL_ORDER: Sequence[str] = (
 )
 
 
+_JSON_PROMPT_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
 def json_dumps_safe(obj: Any, *, indent: int = 2) -> str:
     """Serialise objects to JSON while keeping UTF-8 characters."""
+    # orjson only offers two-space indentation; it covers every prompt caller.
+    if indent == 2:
+        return orjson.dumps(obj, default=json_default, option=_JSON_PROMPT_OPTIONS | orjson.OPT_INDENT_2).decode("utf-8")
+    if not indent:
+        return orjson.dumps(obj, default=json_default, option=_JSON_PROMPT_OPTIONS).decode("utf-8")
     return json.dumps(obj, ensure_ascii=False, indent=indent)
 
 
+def _edge_summary_line(row: Dict[str, Any]) -> str:
+    rel = row.get("rel") or row.get("reltype") or "UNKNOWN"
+    avg_conf = row.get("avg_conf")
+    if avg_conf is None:
+        return f"{rel}: cnt={row.get('cnt', 0)}, avg_conf=?"
+    # A ``.2f`` spec inside the f-string is the cheapest float rendering
+    # CPython offers here; str(round(x, 2)) is ~3x slower and drops zeros.
+    return f"{rel}: cnt={row.get('cnt', 0)}, avg_conf={float(avg_conf):.2f}"
+
+
 def _render_edge_summary_lines(rows: Sequence[Dict[str, Any]]) -> List[str]:
-    lines = ["[EDGE SUMMARY]"]
     if not rows:
-        lines.append("데이터 없음")
-        return lines
-    for row in rows:
-        rel = row.get("rel") or row.get("reltype") or "UNKNOWN"
-        cnt = row.get("cnt", 0)
-        avg_conf = row.get("avg_conf")
-        conf_str = "?" if avg_conf is None else f"{float(avg_conf):.2f}"
-        lines.append(f"{rel}: cnt={cnt}, avg_conf={conf_str}")
-    return lines
+        return ["[EDGE SUMMARY]", "데이터 없음"]
+    return ["[EDGE SUMMARY]", *map(_edge_summary_line, rows)]
 
 
 def _format_edge_summary(rows: Sequence[Dict[str, Any]]) -> str:
@@ -77,12 +90,20 @@ def _categorise_path_slot(row: Dict[str, Any]) -> str:
 
 
 def _build_evidence_paths(paths: Sequence[Dict[str, Any]]) -> List["EvidencePath"]:
+    # Rows come from our own Cypher/dedupe pipeline, so coerce the few fields
+    # and skip per-path pydantic validation.
     evidence_paths: List[EvidencePath] = []
     for path in paths:
         label = path.get("label") or ""
         triples = path.get("triples") or []
         slot = _categorise_path_slot(path) or None
-        evidence_paths.append(EvidencePath(label=label, triples=list(triples), slot=slot))
+        evidence_paths.append(
+            EvidencePath.model_construct(
+                label=str(label),
+                triples=[str(triple) for triple in triples],
+                slot=slot,
+            )
+        )
     return evidence_paths
 
 
@@ -101,6 +122,7 @@ def _build_fallback_path_rows(
     if isinstance(facts_payload, dict):
         findings = facts_payload.get("findings") or []
     image_token = str(image_id or facts_payload.get("image_id") or "").strip() or "UNKNOWN"
+    image_ref = f"Image[{image_token}] -HAS_FINDING-> "
 
     for finding in findings:
         if findings_budget <= 0:
@@ -115,11 +137,10 @@ def _build_fallback_path_rows(
         )
         label = str(finding.get("type") or finding.get("label") or f"Finding[{fid}]")
         location = str(finding.get("location") or "").strip()
-        triples = [
-            f"Image[{image_token}] -HAS_FINDING-> Finding[{fid}]",
-        ]
+        finding_ref = f"Finding[{fid}]"
+        triples = [image_ref + finding_ref]
         if location:
-            triples.append(f"Finding[{fid}] -LOCATED_IN-> Anatomy[{location}]")
+            triples.append(f"{finding_ref} -LOCATED_IN-> Anatomy[{location}]")
         score_raw = finding.get("conf")
         try:
             score = float(score_raw) if score_raw is not None else 0.5
@@ -456,6 +477,13 @@ class GraphContextBuilder:
         if mode_normalised not in {"triples", "json"}:
             raise ValueError("mode must be 'triples' or 'json'")
 
+        if mode_normalised == "json":
+            # JSON mode only renders the facts, so skip the path query (the
+            # heaviest read) and the evidence/summary formatting entirely.
+            bundle_payload = self._repo.query_bundle(image_id)
+            facts_data = bundle_payload.get("facts", {"image_id": image_id, "findings": []})
+            return json_dumps_safe(ContextFacts(**facts_data).model_dump(mode="python"))
+
         context = self.build_context(
             image_id=image_id,
             k=k,
@@ -464,8 +492,6 @@ class GraphContextBuilder:
             beta_report=beta_report,
             k_slots=k_slots,
         )
-        if mode_normalised == "json":
-            return json_dumps_safe(context.facts)
         return context.triples_text
 
     @staticmethod
@@ -480,15 +506,15 @@ class GraphContextBuilder:
             return []
         budget = limit if limit > 0 else len(findings)
         fallback_paths: List[Dict[str, Any]] = []
+        image_ref = f"Image[{image_id}] -HAS_FINDING-> "
         for idx, finding in enumerate(findings[:budget]):
             finding_id = str(finding.get("id") or f"FACT_{idx}")
             finding_type = finding.get("type") or "Finding"
             location = finding.get("location")
-            triples = [
-                f"Image[{image_id}] -HAS_FINDING-> Finding[{finding_id}]",
-            ]
+            finding_ref = f"Finding[{finding_id}]"
+            triples = [image_ref + finding_ref]
             if location:
-                triples.append(f"Finding[{finding_id}] -LOCATED_IN-> Location[{location}]")
+                triples.append(f"{finding_ref} -LOCATED_IN-> Location[{location}]")
             score = float(finding.get("conf") or 0.5)
             fallback_paths.append(
                 {
@@ -708,10 +734,8 @@ class GraphContextBuilder:
             lines.append(f"No path generated{suffix}")
             return "\n".join(lines)
         for idx, path in enumerate(paths, start=1):
-            slot_prefix = f"[{path.slot}] " if path.slot else ""
-            lines.append(f"{idx}) {slot_prefix}{path.label}")
-            for triple in path.triples:
-                lines.append(f"   {triple}")
+            lines.append(f"{idx}) [{path.slot}] {path.label}" if path.slot else f"{idx}) {path.label}")
+            lines.extend(["   " + triple for triple in path.triples])
         return "\n".join(lines)
 
 
@@ -839,7 +863,9 @@ class ContextPackBuilder:
         if raw_overrides and slot_overrides_clean != raw_overrides:
             slot_meta["requested_overrides_raw"] = raw_overrides
 
-        return ContextPack(
+        # Every field below is already typed (validated facts, constructed paths,
+        # sanitised slot ints), so re-running validation would only repeat work.
+        return ContextPack.model_construct(
             edge_summary=edge_summary,
             evidence_paths=evidence_paths,
             facts=facts,
@@ -68,13 +68,14 @@ class DebugPayloadBuilder:
             self._payload["dummy_lookup_source"] = lookup_source
         if warn_on_lookup_miss:
             self._payload["norm_image_id_warning"] = "dummy_lookup_miss"
+        seeded_ids = list(seeded_finding_ids)
         fallback_payload = dict(fallback_meta)
-        if seeded_finding_ids:
-            fallback_payload.setdefault("seeded_ids_head", list(seeded_finding_ids)[:3])
+        if seeded_ids:
+            fallback_payload.setdefault("seeded_ids_head", seeded_ids[:3])
         self._payload["finding_fallback"] = fallback_payload
         if finding_source:
             self._payload["finding_source"] = finding_source
-        self._payload["seeded_finding_ids"] = list(seeded_finding_ids)
+        self._payload["seeded_finding_ids"] = seeded_ids
         self._payload["finding_provenance"] = dict(provenance)
         self._payload["pre_upsert_findings_len"] = len(pre_upsert_findings)
         self._payload["pre_upsert_findings_head"] = pre_upsert_findings[:2]
@@ -4,7 +4,19 @@ from __future__ import annotations
 
 from typing import Dict, List, Tuple
 
-__all__ = ["dedup_findings", "dedup_paths"]
+__all__ = ["dedup_findings", "dedup_paths", "finding_signature"]
+
+
+def finding_signature(finding: Dict) -> Tuple[str, str, float]:
+    """Semantic identity of a finding: normalised type, location and size."""
+
+    finding_type = (finding.get("type") or "").strip().lower()
+    location = (finding.get("location") or "").strip().lower()
+    try:
+        size = round(float(finding.get("size_cm")), 1)
+    except Exception:
+        size = 0.0
+    return (finding_type, location, size)
 
 
 def dedup_findings(findings: List[Dict]) -> List[Dict]:
@@ -13,18 +25,11 @@ def dedup_findings(findings: List[Dict]) -> List[Dict]:
     seen: set[Tuple[str, str, float]] = set()
     deduped: List[Dict] = []
     for finding in findings or []:
-        finding_copy = dict(finding)
-        finding_type = (finding_copy.get("type") or "").strip().lower()
-        location = (finding_copy.get("location") or "").strip().lower()
-        try:
-            size = round(float(finding_copy.get("size_cm")), 1)
-        except Exception:
-            size = 0.0
-        signature = (finding_type, location, size)
+        signature = finding_signature(finding)
         if signature in seen:
             continue
         seen.add(signature)
-        deduped.append(finding_copy)
+        deduped.append(dict(finding))
     return deduped
 
 
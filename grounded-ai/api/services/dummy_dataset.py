@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import base64
 import hashlib
 import json
 import os
@@ -13,6 +12,8 @@ from pathlib import Path
 from typing import Any, Iterable, Optional
 from uuid import uuid4
 
+from utils.b64 import b64decode
+
 try:  # pragma: no cover - runtime import guard for scripts without dependencies
     from models.pipeline import FindingModel
 except Exception:  # pragma: no cover
@@ -46,6 +47,18 @@ def load_ground_truth() -> dict[str, dict[str, Any]]:
     return {entry["id"].upper(): entry for entry in data}
 
 
+@lru_cache()
+def _entries_by_file_name() -> dict[str, dict[str, Any]]:
+    """Reverse index of the ground truth keyed by lower-cased file name."""
+
+    index: dict[str, dict[str, Any]] = {}
+    for entry in load_ground_truth().values():
+        name = entry.get("file_name", "").lower()
+        if name:
+            index.setdefault(name, entry)
+    return index
+
+
 def normalise_id(id: str) -> str:
     """Normalise image identifiers to the `IMG_###` form used by the dataset."""
 
@@ -64,10 +77,7 @@ def lookup_entry(*, id: Optional[str] = None, file_path: Optional[str] = None) -
         if candidate:
             return candidate
     if file_path:
-        name = Path(file_path).name.lower()
-        for entry in records.values():
-            if entry.get("file_name", "").lower() == name:
-                return entry
+        return _entries_by_file_name().get(Path(file_path).name.lower())
     return None
 
 
@@ -75,7 +85,7 @@ def decode_image_payload(image_b64: Optional[str], file_path: Optional[str]) ->
     """Decode an image payload from either base64 input or a file path."""
 
     if image_b64:
-        return base64.b64decode(image_b64), None
+        return b64decode(image_b64), None
     if file_path:
         path = Path(file_path)
         if not path.exists():
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
 
 from services.graph_repo import GraphRepo
 
@@ -27,7 +27,27 @@ class FindingVerifier:
         self._repo = repo
 
     def verify(self, image_id: str, expected_ids: Iterable[str]) -> FindingVerificationResult:
-        expected_unique = sorted({fid for fid in expected_ids if isinstance(fid, str) and fid})
+        expected_unique = _unique_ids(expected_ids)
         actual_ids = self._repo.fetch_finding_ids(image_id, expected_unique if expected_unique else None)
-        actual_unique = sorted({fid for fid in actual_ids if isinstance(fid, str) and fid})
-        return FindingVerificationResult(expected=expected_unique, actual=actual_unique)
+        return FindingVerificationResult(expected=expected_unique, actual=_unique_ids(actual_ids))
+
+    def upsert_and_verify(
+        self,
+        payload: Dict[str, Any],
+        expected_ids: Iterable[str],
+    ) -> Tuple[Dict[str, Any], FindingVerificationResult]:
+        """Upsert ``payload`` and verify its findings, in one transaction when the repo supports it."""
+
+        expected_unique = _unique_ids(expected_ids)
+        fused = getattr(self._repo, "upsert_case_verified", None)
+        if callable(fused):
+            receipt, actual_ids = fused(payload, expected_unique if expected_unique else None)
+        else:
+            receipt = self._repo.upsert_case(payload)
+            image_id = (receipt or {}).get("image_id") or payload["image"]["image_id"]
+            actual_ids = self._repo.fetch_finding_ids(image_id, expected_unique if expected_unique else None)
+        return receipt, FindingVerificationResult(expected=expected_unique, actual=_unique_ids(actual_ids))
+
+
+def _unique_ids(ids: Iterable[str]) -> List[str]:
+    return sorted({fid for fid in ids if isinstance(fid, str) and fid})
@@ -6,8 +6,9 @@ from __future__ import annotations
 
 import hashlib
 import os
+from contextlib import ExitStack
 from copy import deepcopy
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import logging
 
@@ -39,23 +40,22 @@ def _env_float(name: str, default: float) -> float:
         return default
 
 
-UPSERT_CASE_QUERY = """
-WITH $image AS img
-WITH img,
+# Shared per-case body; expects ``img``, ``report_in`` and ``findings_in`` bound.
+_UPSERT_CASE_BODY = """
+WITH img, report_in, findings_in,
      CASE
          WHEN img.storage_uri IS NULL OR trim(img.storage_uri) = '' THEN NULL
          ELSE trim(img.storage_uri)
      END AS storage_uri
 OPTIONAL MATCH (existing:Image {storage_uri: storage_uri})
-WITH img, storage_uri, existing,
+WITH img, report_in, findings_in, storage_uri, existing,
      coalesce(existing.image_id, img.image_id) AS resolved_id
 MERGE (i:Image {image_id: resolved_id})
 SET  i.path = coalesce(img.path, i.path),
      i.modality = coalesce(img.modality, i.modality),
      i.storage_uri = CASE WHEN storage_uri IS NULL THEN i.storage_uri ELSE storage_uri END
-WITH i, img, $report AS r
+WITH i, report_in AS r, findings_in
 
-WITH i, r
 CALL {
   WITH i, r
   WITH i, r WHERE r IS NOT NULL
@@ -67,10 +67,10 @@ CALL {
   MERGE (i)-[:DESCRIBED_BY]->(rep)
   RETURN collect(rep.id) AS _rep_ids
 }
-WITH i
+WITH i, findings_in
 
 // 빈 배열이어도 반드시 1행 유지
-WITH i, coalesce($findings, []) AS fs
+WITH i, coalesce(findings_in, []) AS fs
 WITH i, CASE WHEN size(fs)=0 THEN [NULL] ELSE fs END AS safe_fs
 UNWIND safe_fs AS f
 
@@ -98,9 +98,33 @@ WITH i, collect(fid) AS finding_ids_raw
 
 RETURN
   i.image_id AS image_id,
-  [x IN finding_ids_raw WHERE x IS NOT NULL] AS finding_ids;
+  [x IN finding_ids_raw WHERE x IS NOT NULL] AS finding_ids
 """
 
+UPSERT_CASE_QUERY = (
+    "WITH $image AS img, $report AS report_in, $findings AS findings_in"
+    + _UPSERT_CASE_BODY
+    + ";\n"
+)
+
+# Batched variant: one statement (and one round-trip) for many cases, with a
+# receipt row per input row in submission order.
+UPSERT_CASES_QUERY = (
+    """
+UNWIND range(0, size($rows) - 1) AS row_idx
+CALL {
+  WITH row_idx
+  WITH $rows[row_idx] AS row
+  WITH row.image AS img, row.report AS report_in, row.findings AS findings_in
+"""
+    + _UPSERT_CASE_BODY
+    + """
+}
+RETURN row_idx, image_id, finding_ids
+ORDER BY row_idx;
+"""
+)
+
 FINDING_IDS_QUERY = """
 UNWIND coalesce($expected_ids, [NULL]) AS expected_id
 WITH expected_id
@@ -442,6 +466,20 @@ RETURN seed.image_id AS image_id,
        collect(DISTINCT toLower(a.code)) AS anatomy_codes;
 """
 
+# Same projection as SIMILARITY_CANDIDATES_QUERY, but for every image or an
+# explicit id list; feeds the process-wide SimilarityCandidateCache.
+SIMILARITY_PROFILES_QUERY = """
+MATCH (seed:Image)
+WHERE $image_ids IS NULL OR seed.image_id IN $image_ids
+OPTIONAL MATCH (seed)-[:HAS_FINDING]->(f:Finding)
+OPTIONAL MATCH (f)-[:LOCATED_IN]->(a:Anatomy)
+RETURN seed.image_id AS image_id,
+       seed.modality AS modality,
+       collect(DISTINCT toLower(f.type)) AS finding_types,
+       collect(DISTINCT toLower(f.location)) AS finding_locations,
+       collect(DISTINCT toLower(a.code)) AS anatomy_codes;
+"""
+
 DELETE_SIMILARITY_EDGES_QUERY = """
 MATCH (:Image {image_id:$image_id})-[rel:SIMILAR_TO]->(:Image)
 DELETE rel;
@@ -461,9 +499,27 @@ RETURN count(rel) AS edges;
 """
 
 class GraphRepo:
-    def __init__(self, uri: str, user: str, pwd: str, database: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        uri: str,
+        user: str,
+        pwd: str,
+        database: Optional[str] = None,
+        *,
+        max_pool_size: Optional[int] = None,
+        acquisition_timeout: Optional[float] = None,
+    ) -> None:
+        driver_kwargs: Dict[str, Any] = {}
+        if max_pool_size:
+            # Size to roughly (concurrent graph calls per worker); the server
+            # side limit is shared by every worker process.
+            driver_kwargs["max_connection_pool_size"] = max_pool_size
+        if acquisition_timeout:
+            # Fail fast when the pool is exhausted instead of queueing for the
+            # driver default of 60s.
+            driver_kwargs["connection_acquisition_timeout"] = acquisition_timeout
         try:
-            self._driver = GraphDatabase.driver(uri, auth=(user, pwd))
+            self._driver = GraphDatabase.driver(uri, auth=(user, pwd), **driver_kwargs)
         except Exception as exc:  # pragma: no cover - requires failing driver
             raise RuntimeError("Failed to initialise Neo4j driver") from exc
         self._database = database
@@ -474,7 +530,16 @@ class GraphRepo:
         user = os.getenv("NEO4J_USER", "neo4j")
         pwd = os.getenv("NEO4J_PASS", "test1234")
         database = os.getenv("NEO4J_DATABASE")
-        return cls(uri=uri, user=user, pwd=pwd, database=database)
+        pool_size = os.getenv("NEO4J_MAX_POOL_SIZE")
+        acquisition_timeout = os.getenv("NEO4J_CONNECTION_ACQUISITION_TIMEOUT")
+        return cls(
+            uri=uri,
+            user=user,
+            pwd=pwd,
+            database=database,
+            max_pool_size=int(pool_size) if pool_size else None,
+            acquisition_timeout=float(acquisition_timeout) if acquisition_timeout else None,
+        )
 
     def close(self) -> None:
         if not getattr(self, "_driver", None):  # pragma: no cover - defensive cleanup
@@ -484,6 +549,28 @@ class GraphRepo:
         except Neo4jError:
             pass
 
+    def warm(self, connections: int = 1) -> int:
+        """Open up to ``connections`` pooled Bolt connections with a ``RETURN 1`` probe.
+
+        Sessions are held open together so each probe leases its own
+        connection. Returns how many probes succeeded; failures are logged,
+        not raised, so startup does not depend on Neo4j being reachable.
+        """
+
+        if not self._driver:
+            return 0
+        warmed = 0
+        with ExitStack() as stack:
+            for _ in range(max(connections, 1)):
+                try:
+                    session = stack.enter_context(self._driver.session(database=self._database))
+                    session.run("RETURN 1").consume()
+                except Exception as exc:
+                    logger.warning("graph.pool.warm_failed warmed=%s err=%s", warmed, exc)
+                    break
+                warmed += 1
+        return warmed
+
     def _run_write(self, query: str, parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
         if not self._driver:
             raise RuntimeError("Neo4j driver not initialised")
@@ -497,18 +584,30 @@ class GraphRepo:
             return session.write_transaction(_work)
 
     def _run_read(self, query: str, parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        def _work(tx):
+            result = tx.run(query, parameters)
+            return [record.data() for record in result]
+
+        return self._execute_read(_work, query, parameters)
+
+    def _run_read_one(self, query: str, parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return only the first record; the rest of the stream is never pulled into Python."""
+
+        def _work(tx):
+            for record in tx.run(query, parameters):
+                return record.data()
+            return None
+
+        return self._execute_read(_work, query, parameters)
+
+    def _execute_read(self, work, query: str, parameters: Dict[str, Any]):
         if not self._driver:
             raise RuntimeError("Neo4j driver not initialised")
         with self._driver.session(database=self._database) as session:
-            def _work(tx):
-                result = tx.run(query, parameters)
-                payload = [record.data() for record in result]
-                return payload
-
             try:
                 if hasattr(session, "execute_read"):
-                    return session.execute_read(_work)
-                return session.read_transaction(_work)
+                    return session.execute_read(work)
+                return session.read_transaction(work)
             except Exception:
                 logger.exception("Neo4j read query failed: %s params=%s", query.strip().splitlines()[0], parameters)
                 raise
@@ -636,13 +735,63 @@ class GraphRepo:
 
         return data
 
-    def upsert_case(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def _neo4j_upsert_params(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         params = self.prepare_upsert_parameters(payload)
-        neo4j_params = {
-            "image": dict(params.get("image") or {}),
+        image = dict(params.get("image") or {})
+        if not image.get("image_id"):
+            raise ValueError("image.image_id is required")
+        storage_uri_raw = image.get("storage_uri")
+        image["storage_uri"] = storage_uri_raw.strip() if isinstance(storage_uri_raw, str) else None
+        image.pop("storage_uri_key", None)
+        path_value = image.get("path")
+        if path_value is not None and not isinstance(path_value, str):
+            image["path"] = str(path_value)
+        return {
+            "image": image,
             "report": params.get("report"),
             "findings": params.get("findings") or [],
         }
+
+    def _execute_write(self, tx_fn):
+        if hasattr(self._driver, "execute_write"):
+            return self._driver.execute_write(tx_fn)
+        with self._driver.session(database=self._database) as session:
+            if hasattr(session, "execute_write"):
+                return session.execute_write(tx_fn)
+            return session.write_transaction(tx_fn)
+
+    def upsert_case(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        neo4j_params = self._neo4j_upsert_params(payload)
+        self._log_upsert_params(neo4j_params)
+        return self._execute_write(lambda tx: self._upsert_case_tx(tx, neo4j_params))
+
+    def upsert_case_verified(
+        self,
+        payload: Dict[str, Any],
+        expected_ids: Optional[List[str]] = None,
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """Upsert a case and re-read its finding IDs in the same write transaction.
+
+        Saves the separate read round-trip :meth:`fetch_finding_ids` would cost
+        right after :meth:`upsert_case`.
+        """
+
+        neo4j_params = self._neo4j_upsert_params(payload)
+        self._log_upsert_params(neo4j_params)
+
+        def _tx_fn(tx):
+            receipt = self._upsert_case_tx(tx, neo4j_params)
+            record = tx.run(
+                FINDING_IDS_QUERY,
+                {"image_id": receipt["image_id"], "expected_ids": expected_ids},
+            ).single()
+            ids = record.get("finding_ids") if record else None
+            return receipt, [fid for fid in (ids or []) if isinstance(fid, str)]
+
+        return self._execute_write(_tx_fn)
+
+    @staticmethod
+    def _log_upsert_params(neo4j_params: Dict[str, Any]) -> None:
         logger.info(
             "graph.upsert.params image=%s finding_ids=%s finding_cnt=%s",
             neo4j_params["image"].get("image_id"),
@@ -650,49 +799,57 @@ class GraphRepo:
             len(neo4j_params.get("findings")),
         )
 
-        def _tx_fn(tx):
-            image = neo4j_params["image"]
-            image_id = image.get("image_id")
-            if not image_id:
-                raise ValueError("image.image_id is required")
-            storage_uri_raw = image.get("storage_uri")
-            storage_uri = storage_uri_raw.strip() if isinstance(storage_uri_raw, str) else None
-            image["storage_uri"] = storage_uri
-            image.pop("storage_uri_key", None)
-            path_value = image.get("path")
-            if path_value is not None and not isinstance(path_value, str):
-                image["path"] = str(path_value)
-            rec = tx.run(UPSERT_CASE_QUERY, neo4j_params).single()
-            if rec is None:
-                logger.error(
-                    "graph.upsert.empty_return image=%s findings=%s",
-                    neo4j_params["image"].get("image_id"),
-                    [f.get("id") for f in neo4j_params.get("findings")],
-                )
-                return {"image_id": neo4j_params["image"]["image_id"], "finding_ids": []}
-            logger.info(
-                "graph.upsert.receipt image=%s finding_ids=%s",
-                rec.get("image_id"),
-                rec.get("finding_ids"),
+    @staticmethod
+    def _upsert_case_tx(tx, neo4j_params: Dict[str, Any]) -> Dict[str, Any]:
+        rec = tx.run(UPSERT_CASE_QUERY, neo4j_params).single()
+        if rec is None:
+            logger.error(
+                "graph.upsert.empty_return image=%s findings=%s",
+                neo4j_params["image"].get("image_id"),
+                [f.get("id") for f in neo4j_params.get("findings")],
             )
-            return {
-                "image_id": rec.get("image_id"),
-                "finding_ids": rec.get("finding_ids") or []
-            }
+            return {"image_id": neo4j_params["image"]["image_id"], "finding_ids": []}
+        logger.info(
+            "graph.upsert.receipt image=%s finding_ids=%s",
+            rec.get("image_id"),
+            rec.get("finding_ids"),
+        )
+        return {
+            "image_id": rec.get("image_id"),
+            "finding_ids": rec.get("finding_ids") or []
+        }
 
-        if hasattr(self._driver, "execute_write"):
-            return self._driver.execute_write(_tx_fn)
-        with self._driver.session(database=self._database) as session:
-            if hasattr(session, "execute_write"):
-                return session.execute_write(_tx_fn)
-            return session.write_transaction(_tx_fn)
+    def upsert_cases(self, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Upsert several cases in a single UNWIND statement and transaction.
+
+        Returns one receipt per payload, in order. Validation errors for any
+        payload raise before anything is written.
+        """
+
+        rows = [self._neo4j_upsert_params(payload) for payload in payloads]
+        if not rows:
+            return []
+        logger.info("graph.upsert.batch size=%s", len(rows))
+
+        def _tx_fn(tx):
+            receipts: List[Dict[str, Any]] = [
+                {"image_id": row["image"]["image_id"], "finding_ids": []} for row in rows
+            ]
+            for rec in tx.run(UPSERT_CASES_QUERY, {"rows": rows}):
+                receipts[rec["row_idx"]] = {
+                    "image_id": rec.get("image_id"),
+                    "finding_ids": rec.get("finding_ids") or [],
+                }
+            return receipts
+
+        return self._execute_write(_tx_fn)
 
     def query_bundle(self, image_id: str) -> Dict[str, Any]:
-        records = self._run_read(BUNDLE_QUERY, {"image_id": image_id})
+        record = self._run_read_one(BUNDLE_QUERY, {"image_id": image_id})
         default = {"image_id": image_id, "summary": [], "facts": {"image_id": image_id, "findings": []}}
-        if not records:
+        if not record:
             return default
-        bundle = records[0].get("bundle") if isinstance(records[0], dict) else None
+        bundle = record.get("bundle")
         if not bundle:
             return default
         return bundle
@@ -731,11 +888,8 @@ class GraphRepo:
             "k_reports": _slot_value("reports"),
             "k_similarity": _slot_value("similarity"),
         }
-        records = self._run_read(GRAPH_PATHS_QUERY, params)
-        if not records:
-            return []
-        first_row = records[0] if isinstance(records[0], dict) else {}
-        raw_paths = first_row.get("paths") if isinstance(first_row, dict) else None
+        first_row = self._run_read_one(GRAPH_PATHS_QUERY, params)
+        raw_paths = first_row.get("paths") if first_row else None
         if not raw_paths:
             return []
         normalised: List[Dict[str, Any]] = []
@@ -748,28 +902,31 @@ class GraphRepo:
     def fetch_finding_ids(self, image_id: str, expected_ids: Optional[List[str]] = None) -> List[str]:
         """Return finding IDs currently attached to the image."""
 
-        records = self._run_read(FINDING_IDS_QUERY, {"image_id": image_id, "expected_ids": expected_ids})
-        if not records:
-            return []
-        ids = records[0].get("finding_ids") if isinstance(records[0], dict) else None
+        record = self._run_read_one(FINDING_IDS_QUERY, {"image_id": image_id, "expected_ids": expected_ids})
+        ids = record.get("finding_ids") if record else None
         if not ids:
             return []
         return [fid for fid in ids if isinstance(fid, str)]
 
     def fetch_similarity_candidates(self, image_id: str) -> List[Dict[str, Any]]:
         records = self._run_read(SIMILARITY_CANDIDATES_QUERY, {"image_id": image_id})
-        payload: List[Dict[str, Any]] = []
-        for rec in records:
-            payload.append(
-                {
-                    "image_id": rec.get("image_id"),
-                    "modality": rec.get("modality"),
-                    "finding_types": [item for item in (rec.get("finding_types") or []) if item],
-                    "finding_locations": [item for item in (rec.get("finding_locations") or []) if item],
-                    "anatomy_codes": [item for item in (rec.get("anatomy_codes") or []) if item],
-                }
-            )
-        return payload
+        return [self._similarity_profile(rec) for rec in records]
+
+    def fetch_similarity_profiles(self, image_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Similarity profiles for ``image_ids`` (every image when ``None``)."""
+
+        records = self._run_read(SIMILARITY_PROFILES_QUERY, {"image_ids": image_ids})
+        return [self._similarity_profile(rec) for rec in records]
+
+    @staticmethod
+    def _similarity_profile(rec: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "image_id": rec.get("image_id"),
+            "modality": rec.get("modality"),
+            "finding_types": [item for item in (rec.get("finding_types") or []) if item],
+            "finding_locations": [item for item in (rec.get("finding_locations") or []) if item],
+            "anatomy_codes": [item for item in (rec.get("anatomy_codes") or []) if item],
+        }
 
     def sync_similarity_edges(self, image_id: str, edges: List[Dict[str, Any]]) -> int:
         def _tx_fn(tx):
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Iterable, Optional
 
 from py2neo import Graph, Node, Relationship  # type: ignore
@@ -14,6 +15,33 @@ from py2neo.errors import ClientError  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+_PRIMARY_KEY_BY_LABEL = {
+    "Observation": "observation_id",
+    "Diagnosis": "diagnosis_id",
+    "Procedure": "procedure_id",
+    "Medication": "med_id",
+    "Image": "image_id",
+    "Encounter": "encounter_id",
+}
+
+
+@lru_cache(maxsize=None)
+def _provenance_query(label: str) -> str:
+    """Cypher for linking an inference to its source node, built once per label.
+
+    Labels and property keys cannot be parameters, so the text is specialised
+    per label; memoising it keeps the statement text byte-identical across
+    calls so Neo4j's query plan cache is always hit.
+    """
+
+    key = _PRIMARY_KEY_BY_LABEL.get(label, "id")
+    return (
+        "MATCH (inf:AIInference {inference_id: $inference_id})\n"
+        f"MATCH (src:{label} {{{key}: $identifier}})\n"
+        "MERGE (inf)-[:DERIVES_FROM]->(src)\n"
+        "RETURN count(src) AS matched"
+    )
+
 
 class GraphRepository:
     def __init__(self, uri: str, user: str, password: str) -> None:
@@ -133,14 +161,8 @@ class GraphRepository:
 
             if provenance:
                 for label, identifier in provenance:
-                    key = self._primary_key_for_label(label)
                     result = tx.run(
-                        f"""
-                        MATCH (inf:AIInference {{inference_id: $inference_id}})
-                        MATCH (src:{label} {{{key}: $identifier}})
-                        MERGE (inf)-[:DERIVES_FROM]->(src)
-                        RETURN count(src) AS matched
-                        """,
+                        _provenance_query(label),
                         inference_id=inference_id,
                         identifier=identifier,
                     )
@@ -178,17 +200,6 @@ class GraphRepository:
             logger.exception("Failed to persist inference inference_id=%s", inference_id)
             raise
 
-    def _primary_key_for_label(self, label: str) -> str:
-        mapping = {
-            "Observation": "observation_id",
-            "Diagnosis": "diagnosis_id",
-            "Procedure": "procedure_id",
-            "Medication": "med_id",
-            "Image": "image_id",
-            "Encounter": "encounter_id",
-        }
-        return mapping.get(label, "id")
-
     def set_image_embedding(self, image_id: str, embedding_id: str) -> None:
         self._graph.run(
             """
@@ -11,6 +11,7 @@ import os
 import re
 import hashlib
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Protocol, Tuple
 from uuid import uuid4
@@ -52,6 +53,10 @@ class ImageIdentity:
 
 
 _INVALID_CHARS = re.compile(r"[^A-Za-z0-9]+")
+_NON_IDENTIFIER_CHARS = re.compile(r"[^A-Za-z0-9_]+")
+_SEED_IMG_UNDERSCORE_ID = re.compile(r"^IMG_\d+$")
+_SEED_IMG_ID = re.compile(r"^IMG\d+$")
+_SEED_MODALITY_ID = re.compile(r"^(CT|US|XR)\d+$")
 
 
 def identify_image(
@@ -179,7 +184,7 @@ def _derive_image_id_from_path(path: Optional[str]) -> Tuple[Optional[str], Opti
 def _extract_existing_identifier(stem: Optional[str]) -> Optional[str]:
     if not stem:
         return None
-    cleaned = re.sub(r"[^A-Za-z0-9_]+", "", stem).upper()
+    cleaned = _NON_IDENTIFIER_CHARS.sub("", stem).upper()
     if not cleaned:
         return None
     if cleaned.startswith("IMG"):
@@ -222,19 +227,19 @@ def _resolve_seed_storage_uri(
     normalized_id = (image_id or "").strip().upper()
     stem_upper = stem.upper()
 
-    if re.match(r"^IMG_\d+$", normalized_id):
+    if _SEED_IMG_UNDERSCORE_ID.match(normalized_id):
         return f"/mnt/data/medical_dummy/images/{normalized_id.lower()}{suffix}"
-    if re.match(r"^IMG_\d+$", stem_upper):
+    if _SEED_IMG_UNDERSCORE_ID.match(stem_upper):
         return f"/mnt/data/medical_dummy/images/{stem.lower()}{suffix}"
 
-    if re.match(r"^IMG\d+$", normalized_id):
+    if _SEED_IMG_ID.match(normalized_id):
         return f"/data/dummy/{normalized_id}{suffix}"
-    if re.match(r"^IMG\d+$", stem_upper):
+    if _SEED_IMG_ID.match(stem_upper):
         return f"/data/dummy/{stem_upper}{suffix}"
 
-    if re.match(r"^(CT|US|XR)\d+$", normalized_id):
+    if _SEED_MODALITY_ID.match(normalized_id):
         return f"/data/dummy/{normalized_id}{suffix}"
-    if re.match(r"^(CT|US|XR)\d+$", stem_upper):
+    if _SEED_MODALITY_ID.match(stem_upper):
         return f"/data/dummy/{stem_upper}{suffix}"
 
     if stem.lower().startswith("img_"):
@@ -250,7 +255,10 @@ def _resolve_case_id(payload: ImageIdentityPayload, image_path: Optional[str], i
 
 
 def _slugify(value: str) -> str:
-    cleaned = _INVALID_CHARS.sub("_", value).strip("_")
-    if not cleaned:
-        cleaned = uuid4().hex[:12]
-    return cleaned[:48]
+    # The random fallback must stay outside the cache.
+    return _clean_slug(value) or uuid4().hex[:12]
+
+
+@lru_cache(maxsize=4096)
+def _clean_slug(value: str) -> str:
+    return _INVALID_CHARS.sub("_", value).strip("_")[:48]
@@ -47,6 +47,22 @@ class Neo4jClient:
 
         return await asyncio.to_thread(_work)
 
+    async def run_query_one(self, query: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Like :meth:`run_query` but stops after the first record."""
+
+        if self._driver is None:
+            raise RuntimeError("Neo4j driver not initialised")
+
+        def _work() -> Optional[Dict[str, Any]]:
+            driver = self._driver
+            assert driver is not None
+            with driver.session(database=self.database) as session:
+                for record in session.run(query, params or {}):
+                    return record.data()
+                return None
+
+        return await asyncio.to_thread(_work)
+
     def close(self) -> None:
         if self._driver is None:
             return
@@ -59,9 +75,9 @@ class Neo4jClient:
         """Check that Neo4j responds to a trivial read query."""
 
         try:
-            rows = await self.run_query("RETURN 1 AS up")
+            row = await self.run_query_one("RETURN 1 AS up")
         except Exception:
             return False
-        if not rows:
+        if not row:
             return False
-        return rows[0].get("up") == 1
+        return row.get("up") == 1
@@ -2,19 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import os
 import re
 import time
+from contextlib import nullcontext
 from copy import deepcopy
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from tempfile import NamedTemporaryFile
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from services.dummy_registry import DummyFindingRegistry, FindingStub
 from services.ontology_map import canonicalise_label, canonicalise_location
 from services.vlm_runner import VLMRunner
+from utils.cache import TTLCache, UncachedResult
 
 
 _KEYWORD_MAP: Dict[str, str] = {
@@ -33,18 +38,26 @@ _LOBE_MAP: Dict[str, str] = {
 }
 
 
+_JSON_PROMPT = (
+    "You are a radiology assistant."
+    " Respond ONLY with JSON using this schema: {"
+    '"image":{"modality":"XR|CT|MR", "image_id":"string?"},'
+    '"report":{"id":"string?","text":"string","model":"string?","conf":0-1,"ts":"iso?"},'
+    '"findings":[{"id":"string?","type":"string","location":"string?","size_cm":number?,'
+    '"conf":0-1?}],"caption":"string","caption_ko":"string?"}. '
+    "Ensure valid JSON with double quotes."
+)
+
+
 def _force_json_prompt() -> str:
     """Return a robust instruction that forces JSON responses."""
 
-    return (
-        "You are a radiology assistant."
-        " Respond ONLY with JSON using this schema: {"
-        '"image":{"modality":"XR|CT|MR", "image_id":"string?"},'
-        '"report":{"id":"string?","text":"string","model":"string?","conf":0-1,"ts":"iso?"},'
-        '"findings":[{"id":"string?","type":"string","location":"string?","size_cm":number?,'
-        '"conf":0-1?}],"caption":"string","caption_ko":"string?"}. '
-        "Ensure valid JSON with double quotes."
-    )
+    return _JSON_PROMPT
+
+
+@lru_cache(maxsize=32)
+def _prompt_digest(prompt: str) -> str:
+    return hashlib.blake2b(prompt.encode("utf-8"), digest_size=8).hexdigest()
 
 
 def _derive_image_id(file_path: str) -> str:
@@ -52,6 +65,13 @@ def _derive_image_id(file_path: str) -> str:
     return f"IMG_{digest}"
 
 
+def vlm_output_cache_key(image_bytes: bytes, model: Optional[str], prompt: str) -> Tuple[str, str, str]:
+    """Content-addressed key for a raw VLM caption result."""
+
+    digest = hashlib.blake2b(image_bytes, digest_size=16).hexdigest()
+    return digest, model or "", _prompt_digest(prompt)
+
+
 def _derive_report_id(image_id: str, text: str, model: Optional[str]) -> str:
     key_text = (text or "")[:256]
     seed = f"{image_id}|{key_text}|{model or ''}"
@@ -271,32 +291,70 @@ async def normalize_from_vlm(
     force_dummy_fallback: bool = False,
     cache_seed: Optional[str] = None,
     enable_cache: bool = False,
+    output_cache: Optional[TTLCache] = None,
+    vlm_slots: Optional[asyncio.Semaphore] = None,
+    image_bytes: Optional[bytes] = None,
 ) -> Dict[str, Any]:
-    """Call the VLM and return a normalised payload shared across endpoints."""
+    """Call the VLM and return a normalised payload shared across endpoints.
+
+    ``output_cache`` memoises the raw VLM result by image content, so repeated
+    uploads of the same image skip inference; normalisation (ids, paths,
+    fallbacks) still runs per call. ``vlm_slots`` bounds how many inference
+    calls are in flight at once; cache hits never wait on it.
 
-    if not file_path:
+    Callers that already hold the image pass ``image_bytes``; ``file_path`` is
+    then only recorded as the image path and is not required to exist.
+    """
+
+    if image_bytes is None and not file_path:
         raise ValueError("file_path is required for normalisation")
 
-    path = Path(file_path)
-    if not path.exists():
+    path = Path(file_path) if file_path else None
+    if image_bytes is None and not path.exists():
         raise FileNotFoundError(os.fspath(path))
 
     cache_key: Optional[str] = None
     if enable_cache and cache_seed:
         cache_key = f"v1::{cache_seed}::force={int(force_dummy_fallback)}"
-        cached_payload = _load_cached_normalized(cache_key)
+        cached_payload = await asyncio.to_thread(_load_cached_normalized, cache_key)
         if cached_payload:
             return cached_payload
 
-    image_bytes = path.read_bytes()
+    if image_bytes is None:
+        # Images are often several MB; page them in off the event loop.
+        image_bytes = await asyncio.to_thread(path.read_bytes)
 
     prompt = _force_json_prompt()
+
+    async def _infer() -> Dict[str, Any]:
+        async with vlm_slots or nullcontext():
+            return await vlm_runner.generate(
+                image_bytes=image_bytes,
+                prompt=prompt,
+                task=VLMRunner.Task.CAPTION,
+            )
+
+    async def _infer_cacheable() -> Dict[str, Any]:
+        result = await _infer()
+        # Failed calls come back as mock output with a warning; never pin those.
+        if result.get("warning"):
+            raise UncachedResult(result)
+        return result
+
     start = time.perf_counter()
-    raw_result = await vlm_runner.generate(
-        image_bytes=image_bytes,
-        prompt=prompt,
-        task=VLMRunner.Task.CAPTION,
-    )
+    if output_cache is None:
+        raw_result = await _infer()
+    else:
+        output_key = vlm_output_cache_key(image_bytes, getattr(vlm_runner, "model", None), prompt)
+        cached_result = output_cache.get(output_key)
+        if cached_result is not None:
+            raw_result = {**cached_result, "latency_ms": 0, "cached": True}
+        else:
+            # Concurrent uploads of the same image share one inference.
+            try:
+                raw_result = await output_cache.get_or_load(output_key, _infer_cacheable)
+            except UncachedResult as exc:
+                raw_result = exc.result
     latency_ms = raw_result.get("latency_ms")
     if not isinstance(latency_ms, int):
         latency_ms = int((time.perf_counter() - start) * 1000)
@@ -307,7 +365,9 @@ async def normalize_from_vlm(
     image_payload = parsed.get("image") if isinstance(parsed.get("image"), dict) else {}
     resolved_image_id = image_id or image_payload.get("image_id")
     if not resolved_image_id:
-        resolved_image_id = _derive_image_id(str(path))
+        resolved_image_id = _derive_image_id(
+            str(path) if path is not None else hashlib.sha1(image_bytes).hexdigest()
+        )
 
     modality = image_payload.get("modality") or parsed.get("modality")
 
@@ -371,7 +431,7 @@ async def normalize_from_vlm(
     normalized = {
         "image": {
             "image_id": resolved_image_id,
-            "path": str(path),
+            "path": str(path) if path is not None else None,
             "modality": modality,
         },
         "report": {
@@ -396,7 +456,7 @@ async def normalize_from_vlm(
         "forced": bool(force_dummy_fallback),
     }
     if cache_key:
-        _store_cached_normalized(cache_key, normalized)
+        await asyncio.to_thread(_store_cached_normalized, cache_key, normalized)
     return normalized
 
 
@@ -408,6 +468,7 @@ __all__ = [
     "_derive_finding_id",
     "_fallback_findings_from_caption",
     "clamp_one_line",
+    "vlm_output_cache_key",
 ]
 _CACHE_VERSION = 1
 _CACHE_ENV_VAR = "VISION_DEBUG_CACHE_DIR"
@@ -445,6 +506,16 @@ def _store_cached_normalized(seed: str, normalized: Dict[str, Any]) -> None:
     cache_payload = deepcopy(normalized)
     cache_payload.pop("raw_vlm", None)
     cache_payload["_cache_version"] = _CACHE_VERSION
-    tmp_path = path.with_suffix(".tmp")
-    tmp_path.write_text(json.dumps(cache_payload, ensure_ascii=False), encoding="utf-8")
-    tmp_path.replace(path)
+    # A per-writer temp name keeps concurrent stores of the same seed from
+    # interleaving, and the finally removes it if the write or rename fails.
+    tmp_path: Optional[Path] = None
+    try:
+        with NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, prefix=path.stem, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp_path = Path(tmp.name)
+            tmp.write(json.dumps(cache_payload, ensure_ascii=False))
+        tmp_path.replace(path)
+    finally:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
@@ -7,12 +7,15 @@ import unicodedata
 from typing import Dict, Iterable, List, Optional, Tuple
 
 
+_NON_WORD_CHARS = re.compile(r"[^a-z0-9가-힣]+")
+
+
 def _simplify(value: str) -> str:
     """Normalise strings for case-insensitive, punctuation-free comparison."""
 
     normalised = unicodedata.normalize("NFKD", value).lower()
     normalised = "".join(ch for ch in normalised if not unicodedata.combining(ch))
-    return re.sub(r"[^a-z0-9가-힣]+", "", normalised)
+    return _NON_WORD_CHARS.sub("", normalised)
 
 
 LABEL_CANONICALS: Dict[str, Dict[str, Iterable[str]]] = {
@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 
+_TOKEN_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=4096)
 def _normalise_token(value: Optional[str]) -> Optional[str]:
+    # Candidate profiles repeat the same handful of types/locations, so the
+    # tokens are memoised across every similarity pass.
     if not value:
         return None
-    token = re.sub(r"[^a-z0-9]+", "_", value.strip().lower())
+    token = _TOKEN_SEPARATORS.sub("_", value.strip().lower())
     token = token.strip("_")
     return token or None
 
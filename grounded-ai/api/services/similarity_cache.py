@@ -0,0 +1,66 @@
+"""
+Process-wide snapshot of per-image similarity profiles.
+
+``SIMILARITY_CANDIDATES_QUERY`` scans every ``Image`` node on each analysis.
+The profiles it returns only change when an image's findings are written, so
+this cache keeps one snapshot of all profiles, re-reads just the images that
+were upserted since (``invalidate``), and refreshes the whole snapshot every
+``ttl`` seconds to pick up writes from other processes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from services.graph_repo import GraphRepo
+
+
+class SimilarityCandidateCache:
+    def __init__(self, ttl: float = 30.0, *, timer: Callable[[], float] = time.monotonic) -> None:
+        self.ttl = ttl
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._profiles: Dict[str, Dict[str, Any]] = {}
+        self._loaded_at: Optional[float] = None
+        self._stale: Set[str] = set()
+
+    def invalidate(self, *image_ids: Optional[str]) -> None:
+        with self._lock:
+            self._stale.update(image_id for image_id in image_ids if image_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+            self._loaded_at = None
+            self._stale.clear()
+
+    def candidates(self, repo: GraphRepo, image_id: str) -> List[Dict[str, Any]]:
+        """Equivalent of ``repo.fetch_similarity_candidates(image_id)`` served from the snapshot."""
+
+        with self._lock:
+            expired = self._loaded_at is None or self._timer() - self._loaded_at >= self.ttl
+            stale = None if expired else sorted(self._stale)
+            self._stale.clear()
+        # Reads run outside the lock; a concurrent invalidate() lands in the
+        # next call's stale set, so it is never lost.
+        if stale is None:
+            rows = repo.fetch_similarity_profiles(None)
+            fresh = {row["image_id"]: row for row in rows if row.get("image_id")}
+            with self._lock:
+                self._profiles = fresh
+                self._loaded_at = self._timer()
+        elif stale:
+            rows = repo.fetch_similarity_profiles(stale)
+            with self._lock:
+                for stale_id in stale:
+                    self._profiles.pop(stale_id, None)
+                for row in rows:
+                    if row.get("image_id"):
+                        self._profiles[row["image_id"]] = row
+        with self._lock:
+            return [dict(row) for key, row in self._profiles.items() if key != image_id]
+
+
+__all__ = ["SimilarityCandidateCache"]
@@ -0,0 +1,139 @@
+"""
+Coalesce concurrent graph upserts into batched UNWIND writes.
+
+Requests hand their payload to :class:`UpsertBatcher` and await a receipt; a
+background task drains the queue every ``max_wait`` seconds (or as soon as
+``max_batch`` payloads are pending) and writes them with
+:meth:`GraphRepo.upsert_cases` in a worker thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from services.graph_repo import GraphRepo
+
+logger = logging.getLogger(__name__)
+
+_Pending = Tuple[Dict[str, Any], "asyncio.Future[Dict[str, Any]]"]
+
+
+class UpsertBatcher:
+    def __init__(
+        self,
+        repo: GraphRepo,
+        *,
+        max_batch: int = 64,
+        max_wait: float = 0.01,
+        max_inflight: int = 4,
+    ) -> None:
+        if max_batch <= 0:
+            raise ValueError("max_batch must be positive")
+        self._repo = repo
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        # Bounded so concurrent batches never exceed what the driver pool can serve.
+        self._inflight = asyncio.Semaphore(max_inflight)
+        self._queue: "asyncio.Queue[_Pending]" = asyncio.Queue()
+        self._runner: Optional[asyncio.Task] = None
+        self._flushes: set[asyncio.Task] = set()
+
+    @classmethod
+    def from_env(cls, repo: GraphRepo) -> "UpsertBatcher":
+        return cls(
+            repo,
+            max_batch=int(os.getenv("GRAPH_UPSERT_BATCH_SIZE", "64")),
+            max_wait=float(os.getenv("GRAPH_UPSERT_BATCH_WAIT_MS", "10")) / 1000.0,
+            max_inflight=int(os.getenv("GRAPH_UPSERT_MAX_INFLIGHT", "4")),
+        )
+
+    def start(self) -> None:
+        if self._runner is None:
+            self._runner = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        runner, self._runner = self._runner, None
+        if runner is not None:
+            runner.cancel()
+            try:
+                await runner
+            except asyncio.CancelledError:
+                pass
+        # Flush whatever was queued before shutdown rather than dropping it.
+        leftover: List[_Pending] = []
+        while not self._queue.empty():
+            leftover.append(self._queue.get_nowait())
+        if leftover:
+            await self._flush(leftover)
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    async def submit(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if self._runner is None:
+            return await asyncio.to_thread(self._repo.upsert_case, payload)
+        future: "asyncio.Future[Dict[str, Any]]" = asyncio.get_running_loop().create_future()
+        await self._queue.put((payload, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._inflight.acquire()
+            task = asyncio.create_task(self._flush(batch, release=True))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: List[_Pending], *, release: bool = False) -> None:
+        try:
+            payloads = [payload for payload, _ in batch]
+            try:
+                receipts = await asyncio.to_thread(self._repo.upsert_cases, payloads)
+            except Exception as exc:
+                if len(batch) == 1:
+                    _settle(batch[0][1], error=exc)
+                    return
+                # Isolate the failing payload(s) so one bad case does not fail the batch.
+                logger.warning("graph.upsert.batch_failed size=%s err=%s; retrying individually", len(batch), exc)
+                for payload, future in batch:
+                    try:
+                        receipt = await asyncio.to_thread(self._repo.upsert_case, payload)
+                    except Exception as item_exc:
+                        _settle(future, error=item_exc)
+                    else:
+                        _settle(future, result=receipt)
+                return
+            for (_, future), receipt in zip(batch, receipts):
+                _settle(future, result=receipt)
+        finally:
+            if release:
+                self._inflight.release()
+
+
+def _settle(
+    future: "asyncio.Future[Dict[str, Any]]",
+    *,
+    result: Optional[Dict[str, Any]] = None,
+    error: Optional[BaseException] = None,
+) -> None:
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result or {})
+
+
+__all__ = ["UpsertBatcher"]
@@ -6,13 +6,19 @@ Falls back to mock responses when httpx is unavailable.
 from __future__ import annotations
 
 import asyncio
-import base64
 import os
 import time
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, Optional
 
+import orjson
+
+from utils.b64 import b64encode_ascii
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class Task(str, Enum):
     CAPTION = "caption"
@@ -63,14 +69,20 @@ class VLMRunner:
             "model": self.model,
             "prompt": prompt,
             "options": {"temperature": temperature},
-            "images": [base64.b64encode(image_bytes).decode("utf-8")],
+            "images": [b64encode_ascii(image_bytes)],
             "stream": False,
         }
 
         async def _post() -> Dict[str, Any]:
             client = self._client
             assert client is not None
-            response = await client.post(f"{self.base_url}/api/generate", json=payload)
+            # orjson encodes the multi-megabyte base64 string several times
+            # faster than the stdlib encoder httpx uses for ``json=``.
+            response = await client.post(
+                f"{self.base_url}/api/generate",
+                content=orjson.dumps(payload),
+                headers=_JSON_HEADERS,
+            )
             response.raise_for_status()
             return response.json()
 
@@ -0,0 +1,31 @@
+"""Base64 helpers for image payloads, using pybase64's SIMD codec when installed."""
+
+from __future__ import annotations
+
+import binascii
+from typing import Union
+
+try:  # pragma: no cover - optional accelerator
+    import pybase64
+except ImportError:  # pragma: no cover - stdlib fallback
+    pybase64 = None  # type: ignore[assignment]
+
+__all__ = ["b64decode", "b64encode_ascii"]
+
+
+def b64decode(data: Union[str, bytes]) -> bytes:
+    """Decode ``data`` like ``base64.b64decode``; raises ``binascii.Error``/``ValueError`` on bad input."""
+
+    if pybase64 is not None:
+        return pybase64.b64decode(data, validate=False)
+    # What base64.b64decode does after its argument shuffling; a2b_base64
+    # accepts ASCII str directly and skips non-alphabet bytes the same way.
+    return binascii.a2b_base64(data)
+
+
+def b64encode_ascii(data: bytes) -> str:
+    """Encode ``data`` as a single-line ASCII base64 string."""
+
+    if pybase64 is not None:
+        return pybase64.b64encode(data).decode("ascii")
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
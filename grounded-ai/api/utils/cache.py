@@ -0,0 +1,126 @@
+"""Small in-process LRU + TTL cache used for hot graph read paths."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+__all__ = ["TTLCache", "UncachedResult"]
+
+_MISSING = object()
+
+
+class UncachedResult(Exception):
+    """Raised by a ``get_or_load`` loader to hand back ``result`` without storing it.
+
+    Concurrent callers sharing the load receive the same exception, so each can
+    unwrap ``result`` (e.g. a degraded model response) instead of failing.
+    """
+
+    def __init__(self, result: Any) -> None:
+        super().__init__("uncached result")
+        self.result = result
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire ``ttl`` seconds after insertion.
+
+    ``get_or_load`` adds single-flight loading for coroutine loaders: concurrent
+    misses for the same key share one load. Any invalidation that happens while
+    a load is in flight prevents that (possibly stale) result from being stored,
+    and callers arriving after the invalidation start a fresh load instead of
+    joining it.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+        *,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= self._timer():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (self._timer() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            self._generation += 1
+            entry = self._data.pop(key, None)
+            self._inflight.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drop every entry whose key matches ``predicate``; returns the count removed."""
+
+        with self._lock:
+            self._generation += 1
+            stale = [key for key in self._data if predicate(key)]
+            for key in stale:
+                del self._data[key]
+            # Loads already running may predate the write; later callers start afresh.
+            for key in [key for key in self._inflight if predicate(key)]:
+                del self._inflight[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+            self._inflight.clear()
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        pending = self._inflight.get(key)
+        if pending is None:
+            generation = self._generation
+            pending = asyncio.ensure_future(loader())
+            self._inflight[key] = pending
+
+            def _finish(task: "asyncio.Future[Any]") -> None:
+                if self._inflight.get(key) is task:
+                    del self._inflight[key]
+                if task.cancelled() or task.exception() is not None:
+                    return
+                if generation == self._generation:
+                    self.set(key, task.result())
+
+            pending.add_done_callback(_finish)
+        return await asyncio.shield(pending)
@@ -20,7 +20,7 @@ class StreamWorker:
         group: str,
         consumer_name: str,
         poll_interval: float = 0.1,
-        batch_size: int = 10,
+        batch_size: int = 256,
     ) -> None:
         self.bus = bus
         self.stream = stream
@@ -39,14 +39,16 @@ class StreamWorker:
             self.stream,
             self.group,
         )
-        while self._running:
-            messages = await self.bus.consume(
-                self.stream,
-                self.group,
-                self.consumer_name,
-                count=self.batch_size,
-                block_ms=int(self.poll_interval * 1000),
-            )
+        batches = self.bus.consume_forever(
+            self.stream,
+            self.group,
+            self.consumer_name,
+            count=self.batch_size,
+            block_ms=max(1, int(self.poll_interval * 1000)),
+        )
+        async for messages in batches:
+            if not self._running:
+                break
             if not messages:
                 continue
             ack_ids: list[str] = []
@@ -30,6 +30,10 @@ FOR (a:Anatomy) REQUIRE a.code IS UNIQUE;
 CREATE CONSTRAINT image_image_id IF NOT EXISTS
 FOR (img:Image) REQUIRE img.image_id IS UNIQUE;
 
+// Upserts resolve re-uploads by storage_uri before merging on image_id.
+CREATE INDEX image_storage_uri IF NOT EXISTS
+FOR (img:Image) ON (img.storage_uri);
+
 CREATE CONSTRAINT ai_inference_id IF NOT EXISTS
 FOR (ai:AIInference) REQUIRE ai.inference_id IS UNIQUE;
 
@@ -8,6 +8,7 @@ CREATE CONSTRAINT IF NOT EXISTS FOR (d:Diagnosis) REQUIRE d.diagnosis_id IS UNIQ
 CREATE CONSTRAINT IF NOT EXISTS FOR (pr:Procedure) REQUIRE pr.procedure_id IS UNIQUE;
 CREATE CONSTRAINT IF NOT EXISTS FOR (m:Medication) REQUIRE m.med_id IS UNIQUE;
 CREATE CONSTRAINT IF NOT EXISTS FOR (img:Image) REQUIRE img.image_id IS UNIQUE;
+CREATE INDEX IF NOT EXISTS FOR (img:Image) ON (img.storage_uri);
 CREATE CONSTRAINT IF NOT EXISTS FOR (ai:AIInference) REQUIRE ai.inference_id IS UNIQUE;
 CREATE CONSTRAINT IF NOT EXISTS FOR (ov:OntologyVersion) REQUIRE ov.version_id IS UNIQUE;
 
@@ -60,6 +60,7 @@ if "neo4j" not in sys.modules:
 
 from routers import pipeline
 from routers.pipeline import AnalyzeReq
+from services.context_pack import GraphContextResult
 from services.dummy_registry import FindingStub
 
 
@@ -74,11 +75,19 @@ class _DummyVLMRunner:
 class _FakeGraphRepo:
     def __init__(self) -> None:
         self._closed = False
+        self._finding_ids: List[str] = []
+
+    def prepare_upsert_parameters(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return dict(payload)
 
     def upsert_case(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         finding_ids = [f.get("id") for f in payload.get("findings", []) if f.get("id")]
+        self._finding_ids = finding_ids
         return {"image_id": payload["image"]["image_id"], "finding_ids": finding_ids}
 
+    def fetch_finding_ids(self, image_id: str, expected_ids: Optional[List[str]] = None) -> List[str]:
+        return list(self._finding_ids)
+
     def fetch_similarity_candidates(self, image_id: str) -> List[Dict[str, Any]]:
         return []
 
@@ -94,22 +103,25 @@ class _FakeContextBuilder:
         self._repo = repo
         self._closed = False
 
-    def build_bundle(
+    def build_context(
         self,
-        *,
         image_id: str,
+        *,
         k: int,
         max_chars: int,
         alpha_finding: Optional[float],
         beta_report: Optional[float],
         k_slots: Optional[Dict[str, int]],
-    ) -> Dict[str, Any]:
-        return {
-            "paths": [],
-            "facts": {"findings": [], "paths": []},
-            "summary": {},
-            "slot_limits": {},
-        }
+    ) -> GraphContextResult:
+        return GraphContextResult(
+            summary=[],
+            summary_rows=[],
+            paths=[],
+            facts={"findings": [], "paths": []},
+            triples_text="",
+            slot_limits={},
+            slot_meta={},
+        )
 
     def close(self) -> None:
         self._closed = True
@@ -120,15 +132,13 @@ async def test_pipeline_marks_dummy_seed_fallback(monkeypatch, tmp_path) -> None
     image_path = tmp_path / "img.png"
     image_path.write_bytes(b"\x89PNG")
 
-    async def _fake_ensure_dependencies(request) -> None:  # type: ignore[override]
-        return None
-
     async def _fake_normalize_from_vlm(
         file_path: Optional[str],
         image_id: Optional[str],
         vlm_runner: Any,
         *,
         force_dummy_fallback: bool = False,
+        **_: Any,
     ) -> Dict[str, Any]:
         return {
             "image": {"image_id": image_id or "IMG201", "path": file_path, "modality": "XR"},
@@ -153,7 +163,6 @@ async def test_pipeline_marks_dummy_seed_fallback(monkeypatch, tmp_path) -> None
         )
     ]
 
-    monkeypatch.setattr(pipeline, "_ensure_dependencies", _fake_ensure_dependencies)
     monkeypatch.setattr(pipeline, "normalize_from_vlm", _fake_normalize_from_vlm)
     monkeypatch.setattr(
         pipeline.DummyFindingRegistry,
@@ -203,13 +212,13 @@ async def test_pipeline_marks_dummy_seed_fallback(monkeypatch, tmp_path) -> None
         parameters={"force_dummy_fallback": True},
     )
 
-    response = await pipeline.analyze(
-        payload=payload,
-        request=request,
-        sync=True,
+    response = await pipeline._run_analysis(
+        payload,
+        request,
         debug=True,
         llm=_DummyLLMRunner(),
         vlm=_DummyVLMRunner(),
+        shared_graph_repo=None,
     )
 
     fallback_debug = response.debug.get("finding_fallback") or {}
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from services.similarity_cache import SimilarityCandidateCache
+
+
+class _Repo:
+    def __init__(self) -> None:
+        self.rows = {
+            "IMG_A": {"image_id": "IMG_A", "modality": "CT", "findings": []},
+            "IMG_B": {"image_id": "IMG_B", "modality": "MR", "findings": []},
+        }
+        self.calls: list[object] = []
+
+    def fetch_similarity_profiles(self, image_ids=None):
+        self.calls.append(image_ids)
+        ids = self.rows.keys() if image_ids is None else image_ids
+        return [dict(self.rows[image_id]) for image_id in ids if image_id in self.rows]
+
+
+def test_similarity_cache_excludes_seed_and_reuses_snapshot() -> None:
+    repo = _Repo()
+    cache = SimilarityCandidateCache(ttl=60.0, timer=lambda: 0.0)
+
+    assert [row["image_id"] for row in cache.candidates(repo, "IMG_A")] == ["IMG_B"]
+    assert [row["image_id"] for row in cache.candidates(repo, "IMG_B")] == ["IMG_A"]
+    assert repo.calls == [None]
+
+
+def test_similarity_cache_refreshes_only_invalidated_images() -> None:
+    repo = _Repo()
+    cache = SimilarityCandidateCache(ttl=60.0, timer=lambda: 0.0)
+    cache.candidates(repo, "IMG_A")
+
+    repo.rows["IMG_B"]["modality"] = "CT"
+    repo.rows["IMG_C"] = {"image_id": "IMG_C", "modality": "XR", "findings": []}
+    cache.invalidate("IMG_B", "IMG_C", None)
+
+    rows = {row["image_id"]: row for row in cache.candidates(repo, "IMG_A")}
+    assert rows["IMG_B"]["modality"] == "CT"
+    assert "IMG_C" in rows
+    assert repo.calls == [None, ["IMG_B", "IMG_C"]]
+
+
+def test_similarity_cache_reloads_after_ttl() -> None:
+    repo = _Repo()
+    now = [0.0]
+    cache = SimilarityCandidateCache(ttl=5.0, timer=lambda: now[0])
+    cache.candidates(repo, "IMG_A")
+    now[0] = 10.0
+    cache.candidates(repo, "IMG_A")
+    assert repo.calls == [None, None]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from utils.cache import TTLCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_entries_and_evicts_lru() -> None:
+    clock = _Clock()
+    cache = TTLCache(maxsize=2, ttl=10.0, timer=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # refreshes "a" as most recently used
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+
+    clock.now = 11.0
+    assert cache.get("a") is None
+    assert len(cache) == 1  # "c" is still stored until read
+
+
+def test_ttl_cache_discard_where_matches_key_prefix() -> None:
+    cache = TTLCache()
+    cache.set(("IMG1", 2, "triples"), "x")
+    cache.set(("IMG1", 3, "json"), "y")
+    cache.set(("IMG2", 2, "triples"), "z")
+    assert cache.discard_where(lambda key: key[0] == "IMG1") == 2
+    assert cache.get(("IMG2", 2, "triples")) == "z"
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_get_or_load_single_flight() -> None:
+    cache = TTLCache()
+    calls = 0
+
+    async def loader() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "ctx"
+
+    results = await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(5)))
+    assert results == ["ctx"] * 5
+    assert calls == 1
+    assert cache.get("k") == "ctx"
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_skips_store_when_invalidated_mid_load() -> None:
+    cache = TTLCache()
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def loader() -> str:
+        started.set()
+        await release.wait()
+        return "stale"
+
+    task = asyncio.create_task(cache.get_or_load("k", loader))
+    await started.wait()
+    cache.pop("k")
+    release.set()
+    assert await task == "stale"
+    assert cache.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_caller_after_invalidation_starts_fresh_load() -> None:
+    cache = TTLCache()
+    state = {"value": "old"}
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def loader() -> str:
+        snapshot = state["value"]
+        started.set()
+        await release.wait()
+        return snapshot
+
+    first = asyncio.create_task(cache.get_or_load(("img", "ctx"), loader))
+    await started.wait()
+    state["value"] = "new"
+    cache.discard_where(lambda key: key[0] == "img")
+    started.clear()
+    second = asyncio.create_task(cache.get_or_load(("img", "ctx"), loader))
+    await started.wait()
+    release.set()
+
+    assert await first == "old"
+    assert await second == "new"
+    assert cache.get(("img", "ctx")) == "new"
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from services.upsert_batcher import UpsertBatcher
+
+
+class _Repo:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+        self.singles: list[str] = []
+
+    def upsert_cases(self, payloads):
+        ids = [payload["case_id"] for payload in payloads]
+        self.batches.append(ids)
+        if "bad" in ids:
+            raise ValueError("bad payload")
+        return [{"image_id": case_id, "finding_ids": []} for case_id in ids]
+
+    def upsert_case(self, payload):
+        if payload["case_id"] == "bad":
+            raise ValueError("bad payload")
+        self.singles.append(payload["case_id"])
+        return {"image_id": payload["case_id"], "finding_ids": []}
+
+
+def test_upsert_batcher_coalesces_concurrent_submits() -> None:
+    async def _run() -> None:
+        repo = _Repo()
+        batcher = UpsertBatcher(repo, max_batch=8, max_wait=0.05)
+        batcher.start()
+        receipts = await asyncio.gather(*(batcher.submit({"case_id": f"C{i}"}) for i in range(5)))
+        await batcher.close()
+        assert [receipt["image_id"] for receipt in receipts] == [f"C{i}" for i in range(5)]
+        assert repo.batches == [[f"C{i}" for i in range(5)]]
+
+    asyncio.run(_run())
+
+
+def test_upsert_batcher_isolates_failing_payload() -> None:
+    async def _run() -> None:
+        repo = _Repo()
+        batcher = UpsertBatcher(repo, max_batch=8, max_wait=0.05)
+        batcher.start()
+        results = await asyncio.gather(
+            batcher.submit({"case_id": "ok"}),
+            batcher.submit({"case_id": "bad"}),
+            return_exceptions=True,
+        )
+        await batcher.close()
+        assert results[0]["image_id"] == "ok"
+        assert isinstance(results[1], ValueError)
+        assert repo.singles == ["ok"]
+
+    asyncio.run(_run())
+
+
+def test_upsert_batcher_rejects_empty_batches() -> None:
+    with pytest.raises(ValueError):
+        UpsertBatcher(_Repo(), max_batch=0)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 from typing import List
@@ -11,6 +12,7 @@ from services.normalizer import (
     _normalise_findings,
     normalize_from_vlm,
 )
+from utils.cache import TTLCache
 
 
 class DummyVLMRunner:
@@ -297,3 +299,140 @@ async def test_normalize_from_vlm_cache_key_includes_force_flag(
     )
 
     assert runner.calls == 2, "force flag should produce independent cache entries"
+
+
+@pytest.mark.asyncio
+async def test_normalize_from_vlm_output_cache_is_content_addressed(tmp_path: Path) -> None:
+    first_path = tmp_path / "upload_a.png"
+    second_path = tmp_path / "upload_b.png"
+    first_path.write_bytes(b"\x89PNG-same")
+    second_path.write_bytes(b"\x89PNG-same")
+
+    class CountingRunner(DummyVLMRunner):
+        def __init__(self) -> None:
+            super().__init__()
+            self.calls = 0
+
+        async def generate(self, image_bytes: bytes, prompt: str, task: str) -> dict:  # type: ignore[override]
+            self.calls += 1
+            return {
+                "output": json.dumps(
+                    {
+                        "image": {"modality": "CT"},
+                        "report": {"text": "cached caption", "model": "dummy-vlm"},
+                        "findings": [{"type": "lesion", "location": "liver", "conf": 0.9}],
+                    }
+                ),
+                "latency_ms": 7,
+                "model": "dummy-vlm",
+            }
+
+    runner = CountingRunner()
+    cache = TTLCache(maxsize=4, ttl=60.0)
+    first = await normalize_from_vlm(
+        file_path=str(first_path), image_id="IMG-A", vlm_runner=runner, output_cache=cache
+    )
+    second = await normalize_from_vlm(
+        file_path=str(second_path), image_id="IMG-B", vlm_runner=runner, output_cache=cache
+    )
+
+    assert runner.calls == 1
+    assert second["raw_vlm"]["cached"] is True
+    assert second["vlm_latency_ms"] == 0
+    assert second["image"]["path"] == str(second_path)
+    assert second["image"]["image_id"] == "IMG-B"
+    assert first["caption"] == second["caption"]
+
+
+@pytest.mark.asyncio
+async def test_normalize_from_vlm_output_cache_shares_inflight_inference() -> None:
+    class SlowRunner(DummyVLMRunner):
+        def __init__(self) -> None:
+            super().__init__({"output": "", "latency_ms": 1, "model": "dummy-vlm"})
+            self.calls = 0
+
+        async def generate(self, image_bytes: bytes, prompt: str, task: str) -> dict:  # type: ignore[override]
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return dict(self._payload)
+
+    runner = SlowRunner()
+    cache = TTLCache(maxsize=4, ttl=60.0)
+    results = await asyncio.gather(
+        *(
+            normalize_from_vlm(
+                file_path=None,
+                image_id=f"IMG-{index}",
+                vlm_runner=runner,
+                output_cache=cache,
+                image_bytes=b"\x89PNG-burst",
+            )
+            for index in range(3)
+        )
+    )
+
+    assert runner.calls == 1
+    assert [result["image"]["image_id"] for result in results] == ["IMG-0", "IMG-1", "IMG-2"]
+
+
+@pytest.mark.asyncio
+async def test_normalize_from_vlm_bounds_concurrent_inference(tmp_path: Path) -> None:
+    class TrackingRunner(DummyVLMRunner):
+        def __init__(self) -> None:
+            super().__init__({"output": "", "latency_ms": 1})
+            self.active = 0
+            self.peak = 0
+
+        async def generate(self, image_bytes: bytes, prompt: str, task: str) -> dict:  # type: ignore[override]
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.01)
+            self.active -= 1
+            return dict(self._payload)
+
+    paths = []
+    for index in range(4):
+        path = tmp_path / f"upload_{index}.png"
+        path.write_bytes(f"\x89PNG-{index}".encode())
+        paths.append(path)
+
+    runner = TrackingRunner()
+    slots = asyncio.Semaphore(1)
+    await asyncio.gather(
+        *(
+            normalize_from_vlm(file_path=str(path), image_id=f"IMG-{index}", vlm_runner=runner, vlm_slots=slots)
+            for index, path in enumerate(paths)
+        )
+    )
+
+    assert runner.peak == 1
+
+
+@pytest.mark.asyncio
+async def test_normalize_from_vlm_accepts_in_memory_bytes(tmp_path: Path) -> None:
+    received: List[bytes] = []
+
+    class RecordingRunner(DummyVLMRunner):
+        async def generate(self, image_bytes: bytes, prompt: str, task: str) -> dict:  # type: ignore[override]
+            received.append(image_bytes)
+            return {"output": "", "latency_ms": 3}
+
+    hint_path = tmp_path / "never_written.png"
+    normalized = await normalize_from_vlm(
+        file_path=str(hint_path),
+        image_id="IMG201",
+        vlm_runner=RecordingRunner(),
+        image_bytes=b"\x89PNG-inline",
+    )
+
+    assert received == [b"\x89PNG-inline"]
+    assert normalized["image"]["path"] == str(hint_path)
+
+    anonymous = await normalize_from_vlm(
+        file_path=None,
+        image_id=None,
+        vlm_runner=RecordingRunner(),
+        image_bytes=b"\x89PNG-inline",
+    )
+    assert anonymous["image"]["path"] is None
+    assert anonymous["image"]["image_id"].startswith("IMG_")
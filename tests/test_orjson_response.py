@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from pathlib import Path
+
+import orjson
+import pytest
+
+from utils.orjson_response import ORJSONResponse
+
+
+def test_orjson_response_encodes_known_extra_types() -> None:
+    response = ORJSONResponse({"path": Path("/data/a.png"), "size": Decimal("1.5"), "ids": {"IMG001"}})
+
+    assert orjson.loads(response.body) == {"path": "/data/a.png", "size": "1.5", "ids": ["IMG001"]}
+
+
+def test_orjson_response_rejects_unknown_objects() -> None:
+    with pytest.raises(TypeError):
+        ORJSONResponse({"value": object()})
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import os
 import shutil
 import subprocess
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, Dict, List, Optional
 
+import httpx
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -1494,6 +1498,50 @@ def test_pipeline_analyze_returns_paths_and_consensus(pipeline_app: FastAPI) ->
     assert isinstance(evaluation.get("similar_seed_images"), list)
 
 
+def test_pipeline_analyze_streams_stage_frames(pipeline_app: FastAPI) -> None:
+    client = TestClient(pipeline_app)
+    payload = {
+        "image_id": "US001",
+        "image_b64": _SAMPLE_IMAGE_B64,
+        "modes": ["V", "VL", "VGL"],
+    }
+
+    response = client.post("/pipeline/analyze", params={"stream": True}, json=payload)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    frames = [json.loads(line) for line in response.text.splitlines() if line]
+    stages = [frame["stage"] for frame in frames]
+    assert stages[0] == "vlm"
+    assert "context" in stages
+    assert {frame["mode"] for frame in frames if frame["stage"] == "mode"} == {"V", "VL", "VGL"}
+    assert stages[-1] == "done"
+    final = frames[-1]["response"]
+    assert final["image_id"] == frames[0]["image_id"]
+    assert final["results"]["consensus"]
+
+
+@pytest.mark.asyncio
+async def test_ensure_dependencies_shares_one_probe_round() -> None:
+    class CountingHealthClient:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def get(self, path: str) -> httpx.Response:
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"ok": True})
+
+    health_client = CountingHealthClient()
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(health_client=health_client)))
+
+    await asyncio.gather(*(pipeline_module._ensure_dependencies(request) for _ in range(5)))
+    assert health_client.calls == len(pipeline_module._DEPENDENCY_PROBES)
+
+    await pipeline_module._ensure_dependencies(request)
+    assert health_client.calls == len(pipeline_module._DEPENDENCY_PROBES)
+
+
 @pytest.mark.usefixtures("ensure_dummy_c_seed")
 def test_upsert_case_idempotent_by_storage_uri() -> None:
     repo = GraphRepo.from_env()